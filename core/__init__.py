@@ -6,18 +6,34 @@ Core package for SharePoint Data Migration Cleanup Tool.
 Contains the main functionality for scanning, analyzing, and cleaning files.
 """
 
-# Import main components for easy access
-from core.scanner import Scanner as FileSystemScanner
-from core.data_cleaner import DataCleaner
-from core.data_processor import DataProcessor
+import importlib
 
-# Import analyzers
-from core.analyzers.name_validator import SharePointNameValidator
-from core.analyzers.path_analyzer import PathAnalyzer
-from core.analyzers.duplicate_finder import DuplicateFinder
-from core.analyzers.pii_detector import PIIDetector
+# Main components, imported on first access so that importing one core
+# module does not pull in pandas and every analyzer and fixer
+_EXPORTS = {
+    'Scanner': 'core.scanner',
+    'FileSystemScanner': 'core.file_scanner',
+    'DataCleaner': 'core.data_cleaner',
+    'DataProcessor': 'core.data_processor',
+    
+    # Analyzers
+    'SharePointNameValidator': 'core.analyzers.name_validator',
+    'PathAnalyzer': 'core.analyzers.path_analyzer',
+    'DuplicateFinder': 'core.analyzers.duplicate_finder',
+    'PIIDetector': 'core.analyzers.pii_detector',
+    
+    # Fixers
+    'NameFixer': 'core.fixers.name_fixer',
+    'PathShortener': 'core.fixers.path_shortener',
+    'Deduplicator': 'core.fixers.deduplicator',
+}
 
-# Import fixers
-from core.fixers.name_fixer import NameFixer
-from core.fixers.path_shortener import PathShortener
-from core.fixers.deduplicator import Deduplicator
\ No newline at end of file
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'core' has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
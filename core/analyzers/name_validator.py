@@ -49,11 +49,8 @@ class SharePointNameValidator:
         escaped_chars = [re.escape(char) for char in self.illegal_chars]
         self.illegal_chars_pattern = re.compile(f"[{''.join(escaped_chars)}]")
         
-        # Pattern for leading/trailing spaces
-        self.leading_trailing_spaces_pattern = re.compile(r"(^\s+|\s+$)")
-        
-        # Pattern for leading/trailing dots
-        self.leading_trailing_dots_pattern = re.compile(r"(^\.+|\.+$)")
+        # Reserved names are looked up for every name
+        self._reserved_names = frozenset(self.reserved_names)
         
     def validate_name(self, name):
         """
@@ -80,7 +77,7 @@ class SharePointNameValidator:
             
         # Check for reserved names
         name_without_ext = os.path.splitext(name)[0].upper()
-        if name_without_ext in self.reserved_names:
+        if name_without_ext in self._reserved_names:
             issues.append(f"'{name_without_ext}' is a reserved name in Windows/SharePoint")
             
         # Check for illegal characters
@@ -89,14 +86,15 @@ class SharePointNameValidator:
             char = illegal_chars_match.group(0)
             issues.append(f"Contains illegal character: '{char}'")
             
-        # Check for leading/trailing spaces
+        # Check for leading/trailing spaces and dots with plain string
+        # operations; names are short and the regex engine costs more
         if not self.leading_trailing_spaces:
-            if self.leading_trailing_spaces_pattern.search(name):
+            if name[0].isspace() or name[-1].isspace():
                 issues.append("Contains leading or trailing spaces")
                 
         # Check for leading/trailing dots
         if not self.leading_trailing_dots:
-            if self.leading_trailing_dots_pattern.search(name):
+            if name[0] == '.' or name[-1] == '.':
                 issues.append("Contains leading or trailing dots")
                 
         return len(issues) == 0, issues
@@ -114,11 +112,9 @@ class SharePointNameValidator:
         if not name:
             return "unnamed"
             
-        # Remove illegal characters
-        fixed_name = name
-        for char in self.illegal_chars:
-            fixed_name = fixed_name.replace(char, "_")
-            
+        # Replace illegal characters
+        fixed_name = self.illegal_chars_pattern.sub("_", name)
+        
         # Remove leading/trailing spaces
         fixed_name = fixed_name.strip()
         
@@ -127,7 +123,7 @@ class SharePointNameValidator:
         
         # Check if it's a reserved name
         name_without_ext, ext = os.path.splitext(fixed_name)
-        if name_without_ext.upper() in self.reserved_names:
+        if name_without_ext.upper() in self._reserved_names:
             name_without_ext = f"{name_without_ext}_SP"
             fixed_name = f"{name_without_ext}{ext}"
             
@@ -147,6 +143,26 @@ class SharePointNameValidator:
             
         return fixed_name
         
+    def _validate_names(self, names):
+        """
+        Validate a list of names
+        
+        Args:
+            names (list): File or folder names
+            
+        Returns:
+            list: (is_valid, issues, suggested_name) for each name; issues are
+                joined with semicolons, and both are None for a valid name
+        """
+        results = []
+        for name in names:
+            is_valid, issues = self.validate_name(name)
+            if is_valid:
+                results.append((True, None, None))
+            else:
+                results.append((False, '; '.join(issues), self.suggest_fixed_name(name)))
+        return results
+        
     def analyze_dataframe(self, df):
         """
         Analyze a DataFrame of files and identify naming issues
@@ -162,27 +178,22 @@ class SharePointNameValidator:
         # Create a copy to avoid modifying the original
         result_df = df.copy()
         
-        # Initialize new columns
-        result_df['name_valid'] = True
-        result_df['name_issues'] = None
-        result_df['suggested_name'] = None
+        # Validate every name in one pass
+        results = self._validate_names(result_df['name'].tolist())
         
-        # Validate each file name
-        for index, row in result_df.iterrows():
-            name = row['name']
-            is_valid, issues = self.validate_name(name)
-            
-            result_df.at[index, 'name_valid'] = is_valid
+        if results:
+            valid, issues, suggested = zip(*results)
+        else:
+            valid = issues = suggested = ()
             
-            if not is_valid:
-                # Store issues as a semicolon-separated string
-                result_df.at[index, 'name_issues'] = '; '.join(issues)
-                # Suggest a fixed name
-                result_df.at[index, 'suggested_name'] = self.suggest_fixed_name(name)
+        # Store issues as a semicolon-separated string and suggest a fixed name for invalid names
+        result_df['name_valid'] = pd.Series(valid, index=result_df.index, dtype=bool)
+        result_df['name_issues'] = pd.Series(issues, index=result_df.index, dtype=object)
+        result_df['suggested_name'] = pd.Series(suggested, index=result_df.index, dtype=object)
         
         # Summary statistics
-        invalid_count = len(result_df[result_df['name_valid'] == False])
         total_count = len(result_df)
+        invalid_count = total_count - sum(valid)
         logger.info(f"Found {invalid_count} of {total_count} files with invalid names")
         
         return result_df
\ No newline at end of file
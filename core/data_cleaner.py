@@ -20,6 +20,9 @@ from core.fixers.deduplicator import Deduplicator
 
 logger = logging.getLogger('sharepoint_migration_tool')
 
+# Minimum seconds between progress callbacks
+PROGRESS_INTERVAL = 0.05
+
 class DataCleaner:
     """Implements file cleaning operations"""
     
@@ -35,6 +38,12 @@ class DataCleaner:
         self.is_cleaning = False
         self.cleaned_files = {}
         self.cleaning_thread = None
+        
+        # Target directories already created during the current run
+        self._known_dirs = set()
+        
+        # Issue lookups for the current run, see _build_issue_lookup
+        self._issue_lookup = None
     
     def preview_fixes(self, analysis_results, clean_options):
         """
@@ -153,6 +162,7 @@ class DataCleaner:
         try:
             # Reset cleaned files
             self.cleaned_files = {}
+            self._known_dirs = set()
             
             # Get all files to process
             all_files = analysis_results.get('all_files')
@@ -161,9 +171,14 @@ class DataCleaner:
                     status_callback("No files to process")
                 return
             
+            # Index the issue tables once for the whole run
+            self._issue_lookup = self._build_issue_lookup(analysis_results)
+            
             # Calculate total files
             total_files = len(all_files)
             processed_files = 0
+            last_progress = 0.0
+            last_percent = -1
             
             # Update status
             if status_callback:
@@ -193,18 +208,28 @@ class DataCleaner:
                         file_processed_callback(file_path, processed_path)
                     
                 except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {e}")
+                    logger.error("Error processing file %s: %s", file_path, e)
                     
                     if error_callback:
                         error_callback(f"Error processing file {file_path}: {e}")
                 
-                # Update progress
+                # Update progress when the percentage changes, at most once per PROGRESS_INTERVAL seconds
                 processed_files += 1
                 if progress_callback:
-                    progress_callback(processed_files, total_files)
+                    percent = processed_files * 100 // total_files
+                    now = time.monotonic()
+                    if percent != last_percent and now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        last_percent = percent
+                        progress_callback(processed_files, total_files)
+            
+            # Final progress update
+            if progress_callback and processed_files:
+                progress_callback(processed_files, total_files)
             
             # Finalize
             self.is_cleaning = False
+            self._issue_lookup = None
             
             # Invoke completion callback
             if finished_callback:
@@ -217,6 +242,7 @@ class DataCleaner:
                 error_callback(f"Error during cleaning: {e}")
             
             self.is_cleaning = False
+            self._issue_lookup = None
     
     def _process_file(self, file_path, target_folder, analysis_results, clean_options):
         """
@@ -232,7 +258,7 @@ class DataCleaner:
             str: Path to the processed file, or None if not processed
         """
         if not os.path.exists(file_path):
-            logger.warning(f"File not found: {file_path}")
+            logger.warning("File not found: %s", file_path)
             return None
         
         # Get file information
@@ -241,24 +267,10 @@ class DataCleaner:
         target_path = os.path.join(target_folder, relative_path)
         
         # Check if file has issues
-        has_name_issue = False
-        has_path_issue = False
-        is_duplicate = False
-        
-        # Check for name issues
-        if 'name_issues' in analysis_results:
-            name_issues = analysis_results['name_issues']
-            has_name_issue = any(name_issues['path'] == file_path)
-        
-        # Check for path issues
-        if 'path_issues' in analysis_results:
-            path_issues = analysis_results['path_issues']
-            has_path_issue = any(path_issues['path'] == file_path)
-        
-        # Check for duplicates
-        if 'duplicates' in analysis_results:
-            duplicates = analysis_results['duplicates']
-            is_duplicate = any(duplicates['path'] == file_path)
+        lookup = self._issue_lookup or self._build_issue_lookup(analysis_results)
+        has_name_issue = file_path in lookup['name_issues']
+        has_path_issue = file_path in lookup['path_issues']
+        is_duplicate = file_path in lookup['duplicate_hashes']
         
         # Skip certain files based on options
         if clean_options.get('process_only_issues', False):
@@ -273,33 +285,73 @@ class DataCleaner:
             target_path = self.path_shortener.fix_path(target_path)
         
         if is_duplicate and clean_options.get('fix_duplicates', True):
-            # Find the original file in this duplicate group
-            duplicates = analysis_results['duplicates']
-            duplicate_group = duplicates[duplicates['path'] == file_path]
+            # Find the original file in this duplicate group; the first file
+            # with a given hash is the original
+            file_hash = lookup['duplicate_hashes'][file_path]
+            original = lookup['hash_originals'].get(file_hash)
             
-            if len(duplicate_group) > 0:
-                file_hash = duplicate_group.iloc[0].get('file_hash', '')
-                
-                # Find all files with this hash
-                group_files = duplicates[duplicates['file_hash'] == file_hash]['path'].tolist()
-                
-                if len(group_files) > 0:
-                    # First file is the original, this file is a duplicate
-                    original = group_files[0]
-                    
-                    if file_path != original:
-                        # This is a duplicate
-                        strategy = clean_options.get('duplicate_strategy', 'keep_first')
-                        target_path = self.deduplicator.fix_duplicate(target_path, original, strategy)
+            if original and file_path != original:
+                # This is a duplicate
+                strategy = clean_options.get('duplicate_strategy', 'keep_first')
+                target_path = self.deduplicator.fix_duplicate(target_path, original, strategy)
         
         # Ensure target directory exists
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        self._ensure_directory(os.path.dirname(target_path))
         
         # Copy the file
         shutil.copy2(file_path, target_path)
         
         return target_path
     
+    def _build_issue_lookup(self, analysis_results):
+        """
+        Index the issue tables by path so each file is checked in O(1)
+        
+        Args:
+            analysis_results (dict): Analysis results
+            
+        Returns:
+            dict: 'name_issues' and 'path_issues' path sets, 'duplicate_hashes'
+                mapping duplicate paths to their hash, and 'hash_originals'
+                mapping each hash to the first path that has it
+        """
+        lookup = {
+            'name_issues': set(),
+            'path_issues': set(),
+            'duplicate_hashes': {},
+            'hash_originals': {}
+        }
+        
+        if 'name_issues' in analysis_results:
+            lookup['name_issues'] = set(analysis_results['name_issues']['path'])
+        
+        if 'path_issues' in analysis_results:
+            lookup['path_issues'] = set(analysis_results['path_issues']['path'])
+        
+        if 'duplicates' in analysis_results:
+            duplicates = analysis_results['duplicates']
+            paths = duplicates['path'].tolist()
+            if 'file_hash' in duplicates.columns:
+                hashes = duplicates['file_hash'].tolist()
+            else:
+                hashes = [''] * len(paths)
+            for path, file_hash in zip(paths, hashes):
+                lookup['duplicate_hashes'].setdefault(path, file_hash)
+                lookup['hash_originals'].setdefault(file_hash, path)
+        
+        return lookup
+    
+    def _ensure_directory(self, dir_path):
+        """
+        Create a target directory once per cleaning run
+        
+        Args:
+            dir_path (str): Directory to create
+        """
+        if dir_path not in self._known_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._known_dirs.add(dir_path)
+    
     def stop_cleaning(self):
         """Stop an ongoing cleaning operation"""
         self.is_cleaning = False
\ No newline at end of file
@@ -9,7 +9,9 @@ import tempfile
 import pandas as pd
 import threading
 import shutil
+import time
 from pathlib import Path
+from PyQt5.QtCore import QObject, Qt, pyqtSignal
 
 from core.scanner import Scanner
 from core.analyzers.name_validator import SharePointNameValidator
@@ -19,9 +21,17 @@ from core.analyzers.pii_detector import PIIDetector
 from core.fixers.name_fixer import NameFixer
 from core.fixers.path_shortener import PathShortener
 from core.fixers.deduplicator import Deduplicator
+from utils.fs_cleanup import remove_tree
 
 logger = logging.getLogger('sharepoint_migration_tool')
 
+# Minimum seconds between cleaning progress callbacks
+PROGRESS_INTERVAL = 0.05
+
+class _ResultsRelay(QObject):
+    """Carries prepared scan results from the scanner thread to the GUI thread"""
+    results_ready = pyqtSignal(dict)
+
 class DataProcessor:
     """Integrates scanning, analysis, and cleaning operations with extended options"""
     
@@ -51,10 +61,19 @@ class DataProcessor:
         self.analysis_results = {}
         self.cleaned_files = {}
         
+        # Target directories already created during the current cleaning run
+        self._known_dirs = set()
+        
+        # Whether the current cleaning run hard-links files into its target
+        # (see _copy_file)
+        self._link_files = False
+        self._unlink_existing = False
+        
         # Thread tracking
         self.scan_thread = None
         self.analysis_thread = None
         self.cleaning_thread = None
+        self._scan_relay = None
         
     def start_scan(self, root_path, scan_options=None, callbacks=None):
         """
@@ -79,11 +98,17 @@ class DataProcessor:
         if 'error' in callbacks:
             self.scanner.error_occurred.connect(callbacks['error'])
         
-        # Custom completion handler to transform data
+        # Custom completion handler to transform data. It runs directly in the
+        # scanner thread so the DataFrame conversion and metrics do not block
+        # the GUI; only the finished dictionary is queued to the callback.
+        self._scan_relay = _ResultsRelay()
+        if callbacks.get('scan_completed'):
+            self._scan_relay.results_ready.connect(callbacks['scan_completed'])
+        
         def on_scan_completed(results):
-            self._scan_completed(results, callbacks.get('scan_completed'))
+            self._scan_completed(results, self._scan_relay.results_ready.emit)
         
-        self.scanner.scan_completed.connect(on_scan_completed)
+        self.scanner.scan_completed.connect(on_scan_completed, Qt.DirectConnection)
         
         # Start the scanner thread
         self.scanner.start()
@@ -239,32 +264,45 @@ class DataProcessor:
                 
             # Extract files from file_structure if present
             if 'file_structure' in results and isinstance(results['file_structure'], dict):
-                file_list = []
+                # Collect one list per column rather than a dict per entry, so
+                # pandas does not have to transpose rows of dicts. The entry
+                # count is known up front, so the lists are allocated once and
+                # already hold the folder defaults (no size or extension).
+                file_structure = results['file_structure']
+                total = sum(len(dir_data.get('files', ())) + len(dir_data.get('folders', ()))
+                            for dir_data in file_structure.values())
+                paths = [''] * total
+                names = [''] * total
+                sizes = [0] * total
+                extensions = [''] * total
+                is_folder = [False] * total
+                row = 0
                 
                 # Extract files from file_structure
-                for dir_path, dir_data in results['file_structure'].items():
+                for dir_data in file_structure.values():
                     # Add files
                     for file_info in dir_data.get('files', []):
-                        file_list.append({
-                            'path': file_info.get('path', ''),
-                            'name': file_info.get('name', ''),
-                            'size': file_info.get('size', 0),
-                            'extension': file_info.get('extension', ''),
-                            'is_folder': False
-                        })
+                        paths[row] = file_info.get('path', '')
+                        names[row] = file_info.get('name', '')
+                        sizes[row] = file_info.get('size', 0)
+                        extensions[row] = file_info.get('extension', '')
+                        row += 1
                     
                     # Add folders
                     for folder_info in dir_data.get('folders', []):
-                        file_list.append({
-                            'path': folder_info.get('path', ''),
-                            'name': folder_info.get('name', ''),
-                            'size': 0,
-                            'extension': '',
-                            'is_folder': True
-                        })
+                        paths[row] = folder_info.get('path', '')
+                        names[row] = folder_info.get('name', '')
+                        is_folder[row] = True
+                        row += 1
                 
                 # Create DataFrame
-                self.scan_data = pd.DataFrame(file_list)
+                self.scan_data = pd.DataFrame({
+                    'path': paths,
+                    'name': names,
+                    'size': sizes,
+                    'extension': extensions,
+                    'is_folder': is_folder
+                }, copy=False)
                 return
         
         # If we get here, create an empty DataFrame with expected columns
@@ -345,7 +383,7 @@ class DataProcessor:
             name_results = self.name_validator.analyze_dataframe(self.scan_data)
             self.analysis_results['name_issues'] = name_results[name_results['name_valid'] == False]
             
-            logger.info(f"Found {len(self.analysis_results['name_issues'])} files with name issues")
+            logger.info("Found %d files with name issues", len(self.analysis_results['name_issues']))
             
             # Invoke the callback
             if callback:
@@ -367,7 +405,7 @@ class DataProcessor:
             path_results = self.path_analyzer.analyze_dataframe(self.scan_data)
             self.analysis_results['path_issues'] = path_results[path_results['path_too_long'] == True]
             
-            logger.info(f"Found {len(self.analysis_results['path_issues'])} files with path length issues")
+            logger.info("Found %d files with path length issues", len(self.analysis_results['path_issues']))
             
             # Invoke the callback
             if callback:
@@ -389,7 +427,7 @@ class DataProcessor:
             duplicate_results = self.duplicate_finder.analyze_dataframe(self.scan_data)
             self.analysis_results['duplicates'] = duplicate_results[duplicate_results['is_duplicate'] == True]
             
-            logger.info(f"Found {len(self.analysis_results['duplicates'])} files in duplicate groups")
+            logger.info("Found %d files in duplicate groups", len(self.analysis_results['duplicates']))
             
             # Invoke the callback
             if callback:
@@ -411,7 +449,7 @@ class DataProcessor:
             pii_results = self.pii_detector.analyze_dataframe(self.scan_data)
             self.analysis_results['pii'] = pii_results[pii_results['potential_pii'] == True]
             
-            logger.info(f"Found {len(self.analysis_results['pii'])} files with potential PII")
+            logger.info("Found %d files with potential PII", len(self.analysis_results['pii']))
             
             # Invoke the callback
             if callback:
@@ -560,12 +598,29 @@ class DataProcessor:
         total_files = len(self.scan_data) if self.scan_data is not None else 0
         processed_files = 0
         issues_fixed = 0
+        self._known_dirs = set()
+        self._link_files = clean_options.get('link_files', False)
+        self._unlink_existing = self._link_files
         
         # Check if we have issues to fix
         have_name_issues = 'name_issues' in self.analysis_results and len(self.analysis_results['name_issues']) > 0
         have_path_issues = 'path_issues' in self.analysis_results and len(self.analysis_results['path_issues']) > 0
         have_duplicates = 'duplicates' in self.analysis_results and len(self.analysis_results['duplicates']) > 0
         
+        # Index the issue tables by path once, rather than scanning them per file
+        name_issue_paths = set(self.analysis_results['name_issues']['path']) if have_name_issues else set()
+        path_issue_paths = set(self.analysis_results['path_issues']['path']) if have_path_issues else set()
+        duplicate_info = {}
+        group_originals = {}
+        if have_duplicates:
+            duplicates = self.analysis_results['duplicates']
+            for path, group_id, is_original in zip(duplicates['path'].tolist(),
+                                                   duplicates['duplicate_group'].tolist(),
+                                                   duplicates['is_original'].tolist()):
+                duplicate_info.setdefault(path, (group_id, is_original))
+                if is_original:
+                    group_originals.setdefault(group_id, path)
+        
         # Update initial progress
         if 'progress' in callbacks:
             callbacks['progress'](processed_files, total_files)
@@ -589,18 +644,20 @@ class DataProcessor:
             
             # Update total for progress tracking
             total_files = len(files_to_process)
+            last_progress = 0.0
+            last_percent = -1
             
             # Process each file
             for file_path in files_to_process:
                 # Check if the file exists
                 if not os.path.exists(file_path):
-                    logger.warning(f"File not found: {file_path}")
+                    logger.warning("File not found: %s", file_path)
                     continue
                 
                 # Check if this file has issues
-                has_name_issue = have_name_issues and file_path in self.analysis_results['name_issues']['path'].values
-                has_path_issue = have_path_issues and file_path in self.analysis_results['path_issues']['path'].values
-                is_duplicate = have_duplicates and file_path in self.analysis_results['duplicates']['path'].values
+                has_name_issue = file_path in name_issue_paths
+                has_path_issue = file_path in path_issue_paths
+                is_duplicate = file_path in duplicate_info
                 
                 needs_fixing = (fix_names and has_name_issue) or (fix_paths and has_path_issue) or (remove_duplicates and is_duplicate)
                 
@@ -613,10 +670,10 @@ class DataProcessor:
                         dest_path = os.path.join(target_dir, rel_path)
                         
                         # Create target directory
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                        self._ensure_directory(os.path.dirname(dest_path))
                         
                         # Copy the file
-                        shutil.copy2(file_path, dest_path)
+                        self._copy_file(file_path, dest_path, True)
                         
                         # Store in cleaned files
                         self.cleaned_files[file_path] = dest_path
@@ -635,7 +692,7 @@ class DataProcessor:
                             
                             # Rename the file
                             os.rename(file_path, new_path)
-                            logger.info(f"Renamed: {file_path} -> {new_path}")
+                            logger.info("Renamed: %s -> %s", file_path, new_path)
                             
                             # Update file_path for subsequent operations
                             file_path = new_path
@@ -650,11 +707,11 @@ class DataProcessor:
                             
                             if shortened_path != file_path:
                                 # Create target directory
-                                os.makedirs(os.path.dirname(shortened_path), exist_ok=True)
+                                self._ensure_directory(os.path.dirname(shortened_path))
                                 
                                 # Move the file
                                 shutil.move(file_path, shortened_path)
-                                logger.info(f"Shortened path: {file_path} -> {shortened_path}")
+                                logger.info("Shortened path: %s -> %s", file_path, shortened_path)
                                 
                                 # Update file_path for subsequent operations
                                 file_path = shortened_path
@@ -664,30 +721,19 @@ class DataProcessor:
                     # Handle duplicates
                     if remove_duplicates and is_duplicate:
                         # Find the original in the duplicate group
-                        duplicate_group = self.analysis_results['duplicates'][
-                            self.analysis_results['duplicates']['path'] == file_path
-                        ]
-                        
-                        if not duplicate_group.empty:
-                            group_id = duplicate_group.iloc[0]['duplicate_group']
-                            group_files = self.analysis_results['duplicates'][
-                                self.analysis_results['duplicates']['duplicate_group'] == group_id
-                            ]
+                        if file_path in duplicate_info:
+                            group_id, is_original = duplicate_info[file_path]
                             
                             # Find the original file (usually the first in the group)
-                            original_file = None
-                            for _, row in group_files.iterrows():
-                                if row['is_original']:
-                                    original_file = row['path']
-                                    break
+                            original_file = group_originals.get(group_id)
                             
                             # If this is not the original and we found the original
-                            if not duplicate_group.iloc[0]['is_original'] and original_file:
+                            if not is_original and original_file:
                                 # Check if the original exists
                                 if os.path.exists(original_file):
                                     # Remove the duplicate
                                     os.remove(file_path)
-                                    logger.info(f"Removed duplicate: {file_path} (original: {original_file})")
+                                    logger.info("Removed duplicate: %s (original: %s)", file_path, original_file)
                                     fixed = True
                                     issues_fixed += 1
                     
@@ -730,13 +776,9 @@ class DataProcessor:
                     skip_copy = False
                     if remove_duplicates and is_duplicate:
                         # Find the original in the duplicate group
-                        duplicate_group = self.analysis_results['duplicates'][
-                            self.analysis_results['duplicates']['path'] == file_path
-                        ]
-                        
-                        if not duplicate_group.empty:
+                        if file_path in duplicate_info:
                             # Skip if this is not the original file
-                            if not duplicate_group.iloc[0]['is_original']:
+                            if not duplicate_info[file_path][1]:
                                 skip_copy = True
                                 fixed = True
                                 issues_fixed += 1
@@ -751,21 +793,23 @@ class DataProcessor:
                             dest_path = os.path.join(target_dir, rel_path)
                         
                         # Create target directory
-                        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                        self._ensure_directory(os.path.dirname(dest_path))
                         
                         # Copy the file
-                        if preserve_timestamps:
-                            shutil.copy2(file_path, dest_path)
-                        else:
-                            shutil.copy(file_path, dest_path)
+                        self._copy_file(file_path, dest_path, preserve_timestamps)
                         
                         # Store in cleaned files
                         self.cleaned_files[file_path] = dest_path
                 
-                # Update progress
+                # Update progress when the percentage changes, at most once per PROGRESS_INTERVAL seconds
                 processed_files += 1
-                if 'progress' in callbacks and processed_files % 10 == 0:  # Update every 10 files
-                    callbacks['progress'](processed_files, total_files)
+                if 'progress' in callbacks:
+                    percent = processed_files * 100 // total_files
+                    now = time.monotonic()
+                    if percent != last_percent and now - last_progress >= PROGRESS_INTERVAL:
+                        last_progress = now
+                        last_percent = percent
+                        callbacks['progress'](processed_files, total_files)
             
             # Final progress update
             if 'progress' in callbacks:
@@ -787,6 +831,49 @@ class DataProcessor:
             if 'error' in callbacks:
                 callbacks['error'](str(e))
     
+    def _ensure_directory(self, dir_path):
+        """
+        Create a target directory once per cleaning run
+        
+        Args:
+            dir_path (str): Directory to create
+        """
+        if dir_path not in self._known_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self._known_dirs.add(dir_path)
+    
+    def _copy_file(self, src, dest, preserve_timestamps):
+        """
+        Copy a file into the cleaning target, hard-linking it instead when
+        the run stages files for upload
+        
+        In a run that stages links, an existing destination (another source
+        file that was shortened to the same path) is removed first: it may be a
+        hard link to that source, and copying into it would overwrite the
+        original file.
+        
+        Args:
+            src (str): Source file
+            dest (str): Destination path
+            preserve_timestamps (bool): Whether a copy keeps the source timestamps
+        """
+        if self._unlink_existing and os.path.lexists(dest):
+            os.unlink(dest)
+        
+        if self._link_files:
+            try:
+                os.link(src, dest)
+                return
+            except OSError as e:
+                # Links fail across filesystems and on some volumes; copy for the rest of the run
+                logger.debug("Hard links unavailable for %s, copying files instead: %s", dest, e)
+                self._link_files = False
+        
+        if preserve_timestamps:
+            shutil.copy2(src, dest)
+        else:
+            shutil.copy(src, dest)
+    
     def clean_and_upload(self, source_dir, sharepoint_config, clean_options=None, callbacks=None):
         """
         Clean data and upload directly to SharePoint
@@ -815,15 +902,18 @@ class DataProcessor:
         # Create a temporary directory for cleaned files (if not in destructive mode)
         if not clean_options.get('destructive_mode', False):
             temp_dir = tempfile.mkdtemp(prefix="sharepoint_migration_")
+            
+            # Staged files are only read for the upload, so they can share the source data
+            clean_options = dict(clean_options, link_files=True)
         else:
             # In destructive mode, modifications happen in-place
             temp_dir = None
         
-        logger.info(f"Starting clean and upload: {'Destructive' if clean_options.get('destructive_mode', False) else 'Non-destructive'} mode")
+        logger.info("Starting clean and upload: %s mode", 'Destructive' if clean_options.get('destructive_mode', False) else 'Non-destructive')
         
         # Define callbacks for cleaning process
         def cleaning_completed(result):
-            logger.info(f"Cleaning completed: {result}")
+            logger.info("Cleaning completed: %s", result)
             
             # Only upload if cleaning was successful
             if result.get('success', False):
@@ -921,8 +1011,8 @@ class DataProcessor:
             # Clean up the temporary directory if one was created
             if temp_dir and os.path.exists(temp_dir):
                 try:
-                    shutil.rmtree(temp_dir)
-                    logger.info(f"Removed temporary directory: {temp_dir}")
+                    remove_tree(temp_dir)
+                    logger.info("Removed temporary directory: %s", temp_dir)
                 except Exception as e:
                     logger.warning(f"Error removing temporary directory: {e}")
     
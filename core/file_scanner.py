@@ -10,20 +10,39 @@ import os
 import sys
 import time
 import hashlib
+import threading
 import logging
+import numpy as np
 import pandas as pd
+import sqlite3
 import concurrent.futures
-from datetime import datetime
+from array import array
+from functools import lru_cache
+from dateutil.tz import tzlocal
 import stat
-import re
 import platform
 from pathlib import Path
 
+from core.hash_cache import HashCache
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 logger = logging.getLogger(__name__)
 
 # Define SharePoint constraints
 SHAREPOINT_PATH_LIMIT = 256  # characters
 SHAREPOINT_ILLEGAL_CHARS = r'[~#%&*{}\\:<>?/|"]'
+# Deletes the characters above, so a name containing any of them changes
+# under str.translate; one C-level pass instead of a regex search
+SHAREPOINT_ILLEGAL_CHARS_TABLE = str.maketrans('', '', '~#%&*{}\\:<>?/|"')
 SHAREPOINT_ILLEGAL_NAMES = [
     'CON', 'PRN', 'AUX', 'NUL', 
     'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
@@ -33,6 +52,52 @@ SHAREPOINT_ILLEGAL_PREFIXES = ['.~', '_vti_']
 SHAREPOINT_ILLEGAL_SUFFIXES = ['.files', '_files', '-Dateien', '.data']
 SHAREPOINT_MAX_FILENAME_LENGTH = 128  # characters
 
+# Minimum time between progress callbacks, in seconds
+PROGRESS_INTERVAL = 0.05
+
+# Files larger than this are not hashed
+MAX_HASH_SIZE = 50 * 1024 * 1024
+
+# Files smaller than this are hashed inline; larger ones go to a thread pool
+INLINE_HASH_SIZE = 1024 * 1024
+
+# Threads hashing large files; hashlib and xxhash release the GIL while
+# digesting large buffers, as file reads do
+HASH_WORKERS = min(32, os.cpu_count() or 1)
+
+# Per-file columns collected during a scan, in the order _get_file_info returns them
+FILE_COLUMNS = (
+    'filename', 'directory', 'relative_path', 'full_path', 'size_bytes',
+    'size_formatted', 'created', 'modified', 'accessed', 'permissions',
+    'owner', 'read_only', 'hidden'
+)
+
+# Path-like string columns, the bulk of a files DataFrame's memory
+PATH_COLUMNS = ('filename', 'directory', 'relative_path', 'full_path')
+
+# Store the path columns as Arrow strings (one UTF-8 buffer per column rather
+# than a Python object per cell) when pyarrow is installed and pandas would
+# otherwise infer object columns; pandas 3 already picks Arrow by itself
+ARROW_PATH_STRINGS = pyarrow is not None and pd.Series(['']).dtype == object
+
+# Extension as os.path.splitext finds it: the last dot-suffix, provided some
+# non-dot character comes before it
+EXTENSION_PATTERN = r'^.*[^.].*(\.[^.]*)$'
+
+# Where scandir accepts a directory descriptor, DirEntry.stat() becomes an
+# fstatat() relative to it instead of resolving the full path from the root
+SCANDIR_FD = os.scandir in os.supports_fd
+
+# Read size for hashing when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Bytes compared at the start of same-sized files before hashing them in full
+PREFIX_HASH_SIZE = 4096
+
+# Content hash used for duplicate detection. xxh3 runs at memory bandwidth
+# where MD5 is compute-bound; MD5 is the fallback when xxhash is missing
+HASH_ALGORITHM = 'xxh3_64' if xxhash is not None else 'md5'
+
 # Define MIME types for common file extensions
 MIME_TYPES = {
     '.txt': 'text/plain',
@@ -76,21 +141,114 @@ MIME_TYPES = {
     '.dll': 'application/x-msdownload',
 }
 
+def _file_extension(file_name):
+    """Lower-cased extension of a file name, matching os.path.splitext"""
+    dot = file_name.rfind('.')
+    # Only names starting with dots can have nothing but dots before the last one
+    if dot > 0 and (file_name[0] != '.' or file_name[:dot].lstrip('.')):
+        return file_name[dot:].lower()
+    return ''
+
+@lru_cache(maxsize=None)
+def _owner_name(uid):
+    """
+    Look up the user name for a uid; a tree has few distinct owners, so
+    results are cached.
+    
+    Args:
+        uid (int): Numeric user id
+        
+    Returns:
+        str: User name
+    """
+    import pwd
+    return pwd.getpwuid(uid)[0]
+
+def _new_hash():
+    """Create an empty hash object for HASH_ALGORITHM"""
+    if xxhash is not None:
+        return xxhash.xxh3_64()
+    return hashlib.md5()
+
+def _hash_file(file_path, chunk_size=HASH_CHUNK_SIZE):
+    """
+    Calculate the HASH_ALGORITHM hash of a file.
+    
+    Uses hashlib.file_digest where it exists (Python 3.11+); otherwise
+    reads into one reusable buffer rather than allocating a bytes object
+    per chunk.
+    
+    Args:
+        file_path (str): Path to the file
+        chunk_size (int): Size of chunks to read on Python < 3.11
+    
+    Returns:
+        str: Hexadecimal hash string
+    """
+    with open(file_path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, _new_hash).hexdigest()
+        
+        digest = _new_hash()
+        buffer = bytearray(chunk_size)
+        view = memoryview(buffer)
+        while size := f.readinto(buffer):
+            digest.update(view[:size])
+        return digest.hexdigest()
+
+def _hash_prefix(file_path, size=PREFIX_HASH_SIZE):
+    """
+    Calculate the HASH_ALGORITHM hash of the first bytes of a file.
+    
+    Args:
+        file_path (str): Path to the file
+        size (int): Number of bytes to hash
+    
+    Returns:
+        str: Hexadecimal hash string
+    """
+    with open(file_path, 'rb') as f:
+        digest = _new_hash()
+        digest.update(f.read(size))
+        return digest.hexdigest()
+
+def _try_hash_file(file_path):
+    """
+    Hash a file on a worker thread.
+    
+    Args:
+        file_path (str): Path to the file
+    
+    Returns:
+        tuple: (hash, error) where exactly one of the two is None
+    """
+    try:
+        return _hash_file(file_path), None
+    except OSError as e:
+        return None, str(e)
+
 class FileSystemScanner:
     """
     Scans file systems for SharePoint migration preparation, providing
     detailed file analysis and issue identification with extensive metadata.
     """
     
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, count_files_first=False, cache_path=None):
         """
         Initialize the file system scanner.
         
         Args:
             max_workers (int, optional): Maximum number of worker threads. If None,
                                         it will use the default based on CPU count.
+            count_files_first (bool, optional): Walk the tree once up front to get an
+                                        exact total for progress reporting. Off by
+                                        default since it doubles directory I/O.
+            cache_path (str, optional): SQLite file for reusing file hashes across
+                                        scans. Nothing is written to disk if None.
         """
         self.max_workers = max_workers
+        self.count_files_first = count_files_first
+        self.cache_path = cache_path
         self.scan_results = {
             'total_files': 0,
             'total_folders': 0,
@@ -103,12 +261,19 @@ class FileSystemScanner:
             },
             'avg_path_length': 0,
             'max_path_length': 0,
-            'files': [],  # Detailed file info
+            'file_columns': self._new_file_columns(),  # Detailed file info, column-wise
             'issues': []  # Detailed issue info
         }
         
         # Mapping to track unique files by hash
         self.file_hashes = {}
+        
+        # Set by cancel() to stop a running scan
+        self._stop_event = threading.Event()
+    
+    def cancel(self):
+        """Stop a running scan_directory call; safe to call from any thread."""
+        self._stop_event.set()
     
     def scan_directory(self, root_path, callbacks=None):
         """
@@ -121,58 +286,106 @@ class FileSystemScanner:
                 - scan_completed(results): Called when scan is complete
         
         Returns:
-            dict: The scan results, including file and issue details
+            dict: The scan results, including file and issue details, or None
+                if the scan failed or was cancelled
         """
         start_time = time.time()
         logger.info(f"Starting scan of {root_path}")
         
         # Reset results
         self._reset_results()
+        self._stop_event.clear()
+        stop_event = self._stop_event
         
         # Normalize the root path
         root_path = os.path.abspath(root_path)
         
         try:
-            # First, count the total number of files for progress tracking
-            total_files = sum(len(files) for _, _, files in os.walk(root_path))
-            self.scan_results['total_files'] = total_files
-            
-            logger.info(f"Found {total_files} files to scan")
+            # Optionally count the files first for exact progress tracking;
+            # otherwise progress is reported against a running estimate
+            total_files = 0
+            if self.count_files_first:
+                total_files = self._count_files(root_path)
+                logger.info(f"Found {total_files} files to scan")
             
             # Process files with thread pool for performance
             with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
                 futures = []
+                mtimes_ns = array('q')
+                inodes = array('Q')
                 current_file = 0
+                listed_dirs = 0
+                last_progress = 0.0
                 
                 # Walk the directory tree
-                for dirpath, dirnames, filenames in os.walk(root_path):
+                for dirpath, dir_count, file_entries in self._walk(root_path):
+                    # Check for cancellation once per directory
+                    if stop_event.is_set():
+                        executor.shutdown(cancel_futures=True)
+                        logger.info("Scan cancelled")
+                        return None
+                    
                     # Count folders
-                    self.scan_results['total_folders'] += len(dirnames)
+                    listed_dirs += 1
+                    self.scan_results['total_folders'] += dir_count
                     
-                    # Process each file in this directory
-                    for filename in filenames:
-                        file_path = os.path.join(dirpath, filename)
-                        futures.append(executor.submit(self._process_file, file_path, root_path))
+                    # Process each file in this directory, reusing the stat
+                    # result already fetched through the directory entry
+                    for file_path, file_name, file_stat in file_entries:
+                        futures.append(executor.submit(self._process_file, file_path, root_path,
+                                                       file_stat, dirpath, file_name))
+                        mtimes_ns.append(file_stat.st_mtime_ns)
+                        inodes.append(file_stat.st_ino)
                     
-                    # Update progress
+                    # Update progress, at most once per PROGRESS_INTERVAL seconds
+                    current_file += len(file_entries)
                     if callbacks and 'progress' in callbacks:
-                        current_file += len(filenames)
-                        callbacks['progress'](current_file, total_files)
+                        now = time.monotonic()
+                        if now - last_progress >= PROGRESS_INTERVAL:
+                            last_progress = now
+                            # Without a first-pass count, estimate the total by
+                            # assuming unlisted folders hold as many files as the
+                            # listed ones
+                            estimate = current_file * (self.scan_results['total_folders'] + 1) // listed_dirs
+                            callbacks['progress'](current_file, total_files or estimate)
                 
-                # Wait for all tasks to complete and collect results
-                for future in concurrent.futures.as_completed(futures):
+                # Final progress update
+                if callbacks and 'progress' in callbacks:
+                    callbacks['progress'](current_file, current_file)
+                
+                # Wait for all tasks to complete and append each file's
+                # values to the column buffers
+                columns = self.scan_results['file_columns']
+                appenders = [columns[name].append for name in FILE_COLUMNS]
+                has_issues = columns['has_issues'].append
+                issue_count = columns['issue_count'].append
+                issue_types = columns['issue_types'].append
+                for i, future in enumerate(futures):
                     try:
                         file_data, issues = future.result()
                         if file_data:
-                            self.scan_results['files'].append(file_data)
-                            # Update total size
-                            if 'size_bytes' in file_data:
-                                self.scan_results['total_size'] += file_data['size_bytes']
+                            for append, value in zip(appenders, file_data):
+                                append(value)
+                            columns['mtime_ns'].append(mtimes_ns[i])
+                            columns['inode'].append(inodes[i])
+                            has_issues(bool(issues))
+                            issue_count(len(issues))
+                            issue_types(', '.join(set(issue['issue_type'] for issue in issues)) if issues else None)
                         if issues:
                             self.scan_results['issues'].extend(issues)
                             self.scan_results['total_issues'] += len(issues)
                     except Exception as e:
                         logger.error(f"Error processing file: {str(e)}")
+                
+                # Total the typed size column in one vectorised sum
+                self.scan_results['total_size'] = int(np.frombuffer(columns['size_bytes'], dtype=np.int64).sum())
+            
+            self.scan_results['total_files'] = len(columns['full_path'])
+            columns['hash'] = [None] * self.scan_results['total_files']
+            
+            # Hash file contents once the walk is done and flag duplicates
+            self._hash_files()
+            self._detect_duplicates()
             
             # Process the results for summary statistics
             self._process_results()
@@ -207,123 +420,221 @@ class FileSystemScanner:
             },
             'avg_path_length': 0,
             'max_path_length': 0,
-            'files': [],
+            'file_columns': self._new_file_columns(),
             'issues': []
         }
         self.file_hashes = {}
     
-    def _process_file(self, file_path, root_path):
+    def _new_file_columns(self):
+        """
+        Create empty per-file column buffers.
+        
+        Returns:
+            dict: Column name to list (or typed array) of values
+        """
+        columns = {name: [] for name in FILE_COLUMNS}
+        columns['size_bytes'] = array('q')
+        for name in ('created', 'modified', 'accessed'):
+            columns[name] = array('d')
+        columns['has_issues'] = []
+        columns['issue_count'] = array('i')
+        columns['issue_types'] = []
+        columns['hash'] = []
+        # File identity for the hash cache; not part of files_df
+        columns['mtime_ns'] = array('q')
+        columns['inode'] = array('Q')
+        return columns
+    
+    def _count_files(self, root_path):
+        """
+        Count the files the walk will process, without stat() calls.
+        
+        DirEntry file types come from the directory listing itself, so this
+        pass costs one listing per directory and nothing per file.
+        
+        Args:
+            root_path (str): The root directory to count
+            
+        Returns:
+            int: Number of regular files under root_path
+        """
+        count = 0
+        pending = [root_path]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                count += 1
+                        except OSError:
+                            pass
+            except OSError:
+                continue
+        return count
+    
+    def _walk(self, root_path):
+        """
+        Walk a directory tree with os.scandir.
+        
+        Directories are listed on a thread pool, since scandir and stat
+        release the GIL; each listed directory queues its subdirectories.
+        Directories are yielded in the order their listings complete.
+        
+        Args:
+            root_path (str): The root directory to walk
+            
+        Yields:
+            tuple: (dirpath, dir_count, file_entries) where file_entries is a
+                list of (file_path, file_name, stat_result) tuples for regular files
+        """
+        max_workers = self.max_workers or min(32, (os.cpu_count() or 1) * 4)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {executor.submit(self._list_directory, root_path): root_path}
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    dirpath = pending.pop(future)
+                    try:
+                        subdirs, file_entries = future.result()
+                    except OSError as e:
+                        logger.warning(f"Could not scan directory {dirpath}: {str(e)}")
+                        continue
+                    
+                    for subdir in subdirs:
+                        pending[executor.submit(self._list_directory, subdir)] = subdir
+                    
+                    yield dirpath, len(subdirs), file_entries
+        finally:
+            # Drop queued listings if the caller stops early
+            executor.shutdown(wait=True, cancel_futures=True)
+    
+    def _list_directory(self, dirpath):
+        """
+        List one directory; runs on the walk's thread pool.
+        
+        Directory entries carry their file type, and one stat() call per file
+        is enough for everything the scanner needs. Where the platform allows
+        it, directories are listed through an open descriptor so those stat()
+        calls do not re-resolve every parent directory.
+        
+        Args:
+            dirpath (str): Directory to list
+            
+        Returns:
+            tuple: (subdirs, file_entries) where subdirs is a list of directory
+                paths and file_entries a list of (file_path, file_name, stat_result)
+        """
+        prefix = dirpath if dirpath.endswith(os.sep) else dirpath + os.sep
+        fd = os.open(dirpath, os.O_RDONLY | os.O_DIRECTORY) if SCANDIR_FD else None
+        try:
+            with os.scandir(dirpath if fd is None else fd) as it:
+                entries = list(it)
+            
+            subdirs = []
+            file_entries = []
+            for entry in entries:
+                entry_path = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry_path)
+                    elif entry.is_file():
+                        file_entries.append((entry_path, entry.name, entry.stat()))
+                except OSError as e:
+                    logger.warning(f"Could not stat {entry_path}: {str(e)}")
+            return subdirs, file_entries
+        finally:
+            if fd is not None:
+                os.close(fd)
+    
+    def _process_file(self, file_path, root_path, file_stat=None, directory=None, filename=None):
         """
         Process a single file, collecting detailed information and identifying issues.
         
         Args:
             file_path (str): Path to the file
             root_path (str): Root directory being scanned
+            file_stat (os.stat_result, optional): Stat result from the directory walk
+            directory (str, optional): Directory containing the file, if already known
+            filename (str, optional): Name of the file, if already known
         
         Returns:
             tuple: (file_data, issues) where
-                file_data (dict): Detailed file information
+                file_data (tuple): Detailed file information in FILE_COLUMNS order
                 issues (list): List of issues identified with this file
         """
         try:
             # Skip if not a file
-            if not os.path.isfile(file_path):
+            if file_stat is None and not os.path.isfile(file_path):
                 return None, None
             
             # Get file info
-            file_info = self._get_file_info(file_path, root_path)
-            
-            # Explicitly add extension and path_length if missing
-            if 'extension' not in file_info:
-                file_info['extension'] = os.path.splitext(file_path)[1].lower()
-            if 'path_length' not in file_info:
-                file_info['path_length'] = len(file_path)
+            file_info = self._get_file_info(file_path, root_path, file_stat, directory, filename)
             
             # Check for issues
             issues = self._check_for_issues(file_path, file_info)
             
-            # Update file data if issues were found
-            if issues:
-                file_info['has_issues'] = True
-                file_info['issue_count'] = len(issues)
-                file_info['issue_types'] = ', '.join(set(issue['issue_type'] for issue in issues))
-            
             return file_info, issues
             
         except Exception as e:
             logger.error(f"Error processing file {file_path}: {str(e)}")
             return None, None
     
-    def _get_file_info(self, file_path, root_path):
+    def _get_file_info(self, file_path, root_path, file_stat=None, directory=None, filename=None):
         """
         Get detailed file information including permissions, dates, and more.
         
         Args:
             file_path (str): Path to the file
             root_path (str): Root directory being scanned
+            file_stat (os.stat_result, optional): Stat result from the directory walk
+            directory (str, optional): Directory containing the file, if already known
+            filename (str, optional): Name of the file, if already known
             
         Returns:
-            dict: Detailed file information
+            tuple: Detailed file information in FILE_COLUMNS order
         """
-        # Basic file info
-        filename = os.path.basename(file_path)
-        directory = os.path.dirname(file_path)
-        rel_path = os.path.relpath(file_path, root_path)
-        file_ext = os.path.splitext(file_path)[1].lower()
+        # Basic file info; the walk already knows the name and parent, and
+        # paths under the root only need slicing to make them relative
+        if filename is None:
+            filename = os.path.basename(file_path)
+        if directory is None:
+            directory = os.path.dirname(file_path)
+        if file_path.startswith(root_path):
+            rel_path = file_path[len(root_path):].lstrip(os.sep)
+        else:
+            rel_path = os.path.relpath(file_path, root_path)
         
         # Get file stats
-        file_stat = os.stat(file_path)
+        if file_stat is None:
+            file_stat = os.stat(file_path)
         file_size = file_stat.st_size
         
-        # Convert timestamps to datetime objects
-        create_time = datetime.fromtimestamp(file_stat.st_ctime)
-        mod_time = datetime.fromtimestamp(file_stat.st_mtime)
-        access_time = datetime.fromtimestamp(file_stat.st_atime)
-        
-        # Get path length
-        path_length = len(file_path)
-        
-        # Get MIME type based on extension
-        mime_type = MIME_TYPES.get(file_ext, 'application/octet-stream')
-        
         # Get permissions
         permissions = self._get_permissions(file_stat.st_mode)
         
         # Get owner (if possible)
-        owner = self._get_owner(file_path)
+        owner = self._get_owner(file_path, file_stat)
         
-        # Calculate hash for smaller files
-        file_hash = None
-        if file_size < 50 * 1024 * 1024:  # Only hash files smaller than 50MB
-            try:
-                file_hash = self._calculate_file_hash(file_path)
-            except Exception as e:
-                logger.warning(f"Could not calculate hash for {file_path}: {str(e)}")
-        
-        # Create the file info dictionary
-        file_info = {
-            'filename': filename,
-            'directory': directory,
-            'relative_path': rel_path,
-            'full_path': file_path,
-            'size_bytes': file_size,
-            'size_formatted': self._format_size(file_size),
-            'extension': file_ext,
-            'mime_type': mime_type,
-            'created': create_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'modified': mod_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'accessed': access_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'path_length': path_length,
-            'permissions': permissions,
-            'owner': owner,
-            'read_only': not os.access(file_path, os.W_OK),
-            'hidden': self._is_hidden(file_path),
-            'has_issues': False  # Will be updated if issues are found
-        }
-        
-        # Add hash if available
-        if file_hash:
-            file_info['hash'] = file_hash
+        # Create the file info row
+        file_info = (
+            filename,
+            directory,
+            rel_path,
+            file_path,
+            file_size,
+            self._format_size(file_size),
+            file_stat.st_ctime,  # Converted to datetimes for the whole column at once
+            file_stat.st_mtime,
+            file_stat.st_atime,
+            permissions,
+            owner,
+            not os.access(file_path, os.W_OK),
+            self._is_hidden(file_path)
+        )
         
         return file_info
     
@@ -333,15 +644,16 @@ class FileSystemScanner:
         
         Args:
             file_path (str): Path to the file
-            file_info (dict): File information dictionary
+            file_info (tuple): File information in FILE_COLUMNS order
             
         Returns:
             list: List of issues identified with this file
         """
         issues = []
+        filename, size_bytes, read_only = file_info[0], file_info[4], file_info[11]
+        path_length = len(file_path)
         
         # Check file path length
-        path_length = file_info['path_length']
         if path_length > SHAREPOINT_PATH_LIMIT:
             issues.append({
                 'file_path': file_path,
@@ -353,7 +665,6 @@ class FileSystemScanner:
             })
         
         # Check filename length
-        filename = file_info['filename']
         if len(filename) > SHAREPOINT_MAX_FILENAME_LENGTH:
             issues.append({
                 'file_path': file_path,
@@ -365,7 +676,7 @@ class FileSystemScanner:
             })
         
         # Check for illegal characters
-        if re.search(SHAREPOINT_ILLEGAL_CHARS, filename):
+        if filename.translate(SHAREPOINT_ILLEGAL_CHARS_TABLE) != filename:
             issues.append({
                 'file_path': file_path,
                 'issue_type': 'Illegal Characters',
@@ -376,7 +687,7 @@ class FileSystemScanner:
             })
         
         # Check for reserved names
-        name_without_ext = os.path.splitext(filename)[0].upper()
+        name_without_ext = filename[:len(filename) - len(_file_extension(filename))].upper()
         if name_without_ext in SHAREPOINT_ILLEGAL_NAMES:
             issues.append({
                 'file_path': file_path,
@@ -413,23 +724,8 @@ class FileSystemScanner:
                 })
                 break
         
-        # Check for duplicate files - if hash is available
-        if 'hash' in file_info:
-            file_hash = file_info['hash']
-            if file_hash in self.file_hashes:
-                duplicate_path = self.file_hashes[file_hash]
-                issues.append({
-                    'file_path': file_path,
-                    'issue_type': 'Duplicate File',
-                    'description': 'File content is identical to another file',
-                    'severity': 'Warning',
-                    'duplicate_of': duplicate_path
-                })
-            else:
-                self.file_hashes[file_hash] = file_path
-        
         # Check for read-only files (warning for SharePoint upload)
-        if file_info.get('read_only', False):
+        if read_only:
             issues.append({
                 'file_path': file_path,
                 'issue_type': 'Read-Only File',
@@ -439,7 +735,7 @@ class FileSystemScanner:
             })
         
         # Check for zero-byte files (potential issues)
-        if file_info.get('size_bytes', 0) == 0:
+        if size_bytes == 0:
             issues.append({
                 'file_path': file_path,
                 'issue_type': 'Zero-Byte File',
@@ -450,6 +746,153 @@ class FileSystemScanner:
         
         return issues
     
+    def _hash_files(self):
+        """
+        Hash the contents of scanned files that could be duplicates.
+        
+        Files can only have identical content if they have the same size, so
+        only files sharing their size with at least one other file are hashed,
+        and of those, files larger than PREFIX_HASH_SIZE are only hashed in
+        full when their first bytes also match another file's. Files smaller
+        than INLINE_HASH_SIZE are hashed inline; larger ones are spread over a
+        pool of HASH_WORKERS threads, which read and digest in parallel since
+        both release the GIL.
+        """
+        columns = self.scan_results['file_columns']
+        paths = columns['full_path']
+        hashes = columns['hash']
+        
+        # Group files by size and keep the sizes that occur more than once
+        sizes = np.frombuffer(columns['size_bytes'], dtype=np.int64)
+        _, inverse, counts = np.unique(sizes, return_inverse=True, return_counts=True)
+        candidates = np.flatnonzero((counts[inverse] > 1) & (sizes < MAX_HASH_SIZE))  # Only hash files smaller than 50MB
+        
+        cache = None
+        if self.cache_path:
+            try:
+                cache = HashCache(self.cache_path, HASH_ALGORITHM)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not open hash cache {self.cache_path}: {str(e)}")
+        
+        try:
+            # Reuse hashes of files that have not changed since the last scan
+            if cache:
+                mtimes_ns = columns['mtime_ns']
+                inodes = columns['inode']
+                misses = []
+                cached_sizes = set()
+                for i in candidates.tolist():
+                    cached_hash = cache.get(paths[i], int(sizes[i]), mtimes_ns[i], inodes[i])
+                    if cached_hash:
+                        hashes[i] = cached_hash
+                        cached_sizes.add(int(sizes[i]))
+                    else:
+                        misses.append(i)
+                candidates = np.array(misses, dtype=np.intp)
+            else:
+                cached_sizes = set()
+            
+            # Most same-sized files already differ in their first bytes
+            candidates = self._filter_by_prefix(candidates, sizes, paths, cached_sizes)
+            
+            inline_files = candidates[sizes[candidates] < INLINE_HASH_SIZE].tolist()
+            pooled_files = candidates[sizes[candidates] >= INLINE_HASH_SIZE].tolist()
+            
+            for i in inline_files:
+                try:
+                    hashes[i] = self._calculate_file_hash(paths[i])
+                except Exception as e:
+                    logger.warning(f"Could not calculate hash for {paths[i]}: {str(e)}")
+            
+            if pooled_files:
+                pooled_paths = [paths[i] for i in pooled_files]
+                try:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+                        results = list(executor.map(_try_hash_file, pooled_paths))
+                except RuntimeError as e:
+                    # No worker threads could be started; hash on this thread instead
+                    logger.warning(f"Could not hash files in parallel, hashing inline: {str(e)}")
+                    results = [_try_hash_file(path) for path in pooled_paths]
+                
+                for i, (file_hash, error) in zip(pooled_files, results):
+                    if file_hash:
+                        hashes[i] = file_hash
+                    else:
+                        logger.warning(f"Could not calculate hash for {paths[i]}: {error}")
+            
+            if cache:
+                for i in candidates.tolist():
+                    if hashes[i]:
+                        cache.put(paths[i], int(sizes[i]), mtimes_ns[i], inodes[i], hashes[i])
+        finally:
+            if cache:
+                cache.close()
+    
+    def _filter_by_prefix(self, candidates, sizes, paths, keep_sizes=()):
+        """
+        Drop candidates whose first bytes match no other file of the same size.
+        
+        Args:
+            candidates (numpy.ndarray): Indices of the files to be hashed
+            sizes (numpy.ndarray): Size of every scanned file
+            paths (list): Full path of every scanned file
+            keep_sizes (set): Sizes to keep unfiltered, e.g. because a file of
+                that size has a cached full hash but no prefix to compare
+        
+        Returns:
+            numpy.ndarray: Indices of the files that still need a full hash
+        """
+        kept = []
+        groups = {}
+        for i in candidates.tolist():
+            size = int(sizes[i])
+            if size <= PREFIX_HASH_SIZE or size in keep_sizes:
+                # The prefix would be the whole file
+                kept.append(i)
+                continue
+            try:
+                prefix = _hash_prefix(paths[i])
+            except OSError as e:
+                logger.warning(f"Could not calculate hash for {paths[i]}: {str(e)}")
+                continue
+            groups.setdefault((size, prefix), []).append(i)
+        
+        for members in groups.values():
+            if len(members) > 1:
+                kept.extend(members)
+        kept.sort()
+        return np.array(kept, dtype=np.intp)
+    
+    def _detect_duplicates(self):
+        """Flag files whose content hash matches an earlier file."""
+        columns = self.scan_results['file_columns']
+        paths = columns['full_path']
+        hashes = columns['hash']
+        for i in sorted(range(len(paths)), key=paths.__getitem__):
+            file_hash = hashes[i]
+            if not file_hash:
+                continue
+            
+            file_path = paths[i]
+            original_path = self.file_hashes.setdefault(file_hash, file_path)
+            if original_path == file_path:
+                continue
+            
+            self.scan_results['issues'].append({
+                'file_path': file_path,
+                'issue_type': 'Duplicate File',
+                'description': 'File content is identical to another file',
+                'severity': 'Warning',
+                'duplicate_of': original_path
+            })
+            self.scan_results['total_issues'] += 1
+            
+            # Update the file's issue summary
+            columns['has_issues'][i] = True
+            columns['issue_count'][i] += 1
+            issue_types = columns['issue_types'][i]
+            columns['issue_types'][i] = f"{issue_types}, Duplicate File" if issue_types else 'Duplicate File'
+    
     def _get_permissions(self, mode):
         """
         Get file permissions in readable format.
@@ -480,12 +923,13 @@ class FileSystemScanner:
                         perms.append('-')
             return ''.join(perms)
     
-    def _get_owner(self, file_path):
+    def _get_owner(self, file_path, file_stat=None):
         """
         Get file owner if possible.
         
         Args:
             file_path (str): Path to the file
+            file_stat (os.stat_result, optional): Stat result already taken for the file
             
         Returns:
             str: Owner name or unknown
@@ -498,11 +942,9 @@ class FileSystemScanner:
                 name, domain, type = win32security.LookupAccountSid(None, owner_sid)
                 return f"{domain}\\{name}"
             else:
-                import pwd
-                stat_info = os.stat(file_path)
-                uid = stat_info.st_uid
-                user = pwd.getpwuid(uid)[0]
-                return user
+                # Reuse the walk's stat rather than resolving the path again
+                stat_info = file_stat if file_stat is not None else os.stat(file_path)
+                return _owner_name(stat_info.st_uid)
         except:
             return "Unknown"
     
@@ -527,9 +969,9 @@ class FileSystemScanner:
         except:
             return False
     
-    def _calculate_file_hash(self, file_path, chunk_size=8192):
+    def _calculate_file_hash(self, file_path, chunk_size=HASH_CHUNK_SIZE):
         """
-        Calculate MD5 hash of a file.
+        Calculate the content hash (HASH_ALGORITHM) of a file.
         
         Args:
             file_path (str): Path to the file
@@ -538,11 +980,7 @@ class FileSystemScanner:
         Returns:
             str: Hexadecimal hash string
         """
-        md5 = hashlib.md5()
-        with open(file_path, 'rb') as f:
-            while chunk := f.read(chunk_size):
-                md5.update(chunk)
-        return md5.hexdigest()
+        return _hash_file(file_path, chunk_size)
     
     def _format_size(self, size_bytes):
         """
@@ -560,62 +998,77 @@ class FileSystemScanner:
             size_bytes /= 1024
         return f"{size_bytes:.2f} PB"
     
+    def _to_local_datetimes(self, timestamps):
+        """
+        Convert POSIX timestamps to local, second-resolution datetimes.
+        
+        Args:
+            timestamps (array.array): Timestamps in seconds
+        
+        Returns:
+            pandas.DatetimeIndex: Naive local datetimes
+        """
+        times = pd.to_datetime(np.frombuffer(timestamps, dtype=np.float64), unit='s', utc=True)
+        return times.tz_convert(tzlocal()).tz_localize(None).floor('s')
+    
+    def _build_files_df(self):
+        """
+        Build the files DataFrame from the column buffers in one step.
+        
+        Returns:
+            pandas.DataFrame: DataFrame of file information
+        """
+        columns = self.scan_results['file_columns']
+        data = {name: values for name, values in columns.items() if name not in ('mtime_ns', 'inode')}
+        data['size_bytes'] = np.frombuffer(columns['size_bytes'], dtype=np.int64)
+        data['issue_count'] = np.frombuffer(columns['issue_count'], dtype=np.int32)
+        data['has_issues'] = np.array(columns['has_issues'], dtype=bool)
+        data['read_only'] = np.array(columns['read_only'], dtype=bool)
+        for name in ('created', 'modified', 'accessed'):
+            data[name] = self._to_local_datetimes(columns[name])
+        if ARROW_PATH_STRINGS:
+            for name in PATH_COLUMNS:
+                data[name] = pd.array(data[name], dtype='string[pyarrow]')
+        files_df = pd.DataFrame(data)
+        
+        # Derive name-based columns with vectorised string operations
+        extension = files_df['filename'].str.extract(EXTENSION_PATTERN, expand=False).fillna('').str.lower()
+        position = files_df.columns.get_loc('size_formatted') + 1
+        files_df.insert(position, 'extension', extension)
+        files_df.insert(position + 1, 'mime_type', extension.map(MIME_TYPES).fillna('application/octet-stream'))
+        files_df.insert(files_df.columns.get_loc('accessed') + 1, 'path_length', files_df['full_path'].str.len())
+        return files_df
+    
     def _process_results(self):
         """Process raw scan results to calculate summary statistics."""
-        if not self.scan_results['files']:
+        if not self.scan_results['total_files']:
             return
                 
         # Convert to DataFrame for easier processing
-        files_df = pd.DataFrame(self.scan_results['files'])
+        files_df = self._build_files_df()
         
-        # Calculate file type distribution - make sure this happens
-        if 'extension' in files_df.columns:
-            self.scan_results['file_types'] = files_df['extension'].value_counts().to_dict()
-        else:
-            # If no extension column, create a file type distribution from filenames
-            self.scan_results['file_types'] = {}
-            for file_info in self.scan_results['files']:
-                # Get extension from filename
-                filename = file_info.get('filename', '')
-                ext = os.path.splitext(filename)[1].lower() or 'no extension'
-                if ext not in self.scan_results['file_types']:
-                    self.scan_results['file_types'][ext] = 0
-                self.scan_results['file_types'][ext] += 1
-        
-        # Calculate path length distribution - ensure this works
-        if 'path_length' in files_df.columns:
-            # Get actual distribution
-            path_lengths = files_df['path_length'].value_counts().to_dict()
-            # Create bins for the visualization
-            bins = {50: 0, 100: 0, 150: 0, 200: 0, 250: 0, 300: 0}
-            for length, count in path_lengths.items():
-                for bin_val in sorted(bins.keys()):
-                    if length <= bin_val:
-                        bins[bin_val] += count
-                        break
-            self.scan_results['path_length_distribution'] = bins
-        else:
-            # If no path_length column, estimate from full_path
-            self.scan_results['path_length_distribution'] = {50: 0, 100: 0, 150: 0, 200: 0, 250: 0, 300: 0}
-            if 'full_path' in files_df.columns:
-                for _, row in files_df.iterrows():
-                    path_length = len(row['full_path'])
-                    for bin_val in sorted(self.scan_results['path_length_distribution'].keys()):
-                        if path_length <= bin_val:
-                            self.scan_results['path_length_distribution'][bin_val] += 1
-                            break
+        # Calculate file type distribution
+        self.scan_results['file_types'] = files_df['extension'].value_counts().to_dict()
+        
+        # Calculate path length distribution
+        path_lengths = files_df['path_length'].value_counts().to_dict()
+        # Create bins for the visualization
+        bins = {50: 0, 100: 0, 150: 0, 200: 0, 250: 0, 300: 0}
+        for length, count in path_lengths.items():
+            for bin_val in sorted(bins.keys()):
+                if length <= bin_val:
+                    bins[bin_val] += count
+                    break
+        self.scan_results['path_length_distribution'] = bins
         
         # Calculate average and max path length
-        if 'path_length' in files_df.columns:
-            self.scan_results['avg_path_length'] = int(files_df['path_length'].mean())
-            self.scan_results['max_path_length'] = int(files_df['path_length'].max())
-        elif 'full_path' in files_df.columns:
-            path_lengths = files_df['full_path'].str.len()
-            self.scan_results['avg_path_length'] = int(path_lengths.mean())
-            self.scan_results['max_path_length'] = int(path_lengths.max())
-        
-        # Convert files list to DataFrame for the UI
+        self.scan_results['avg_path_length'] = int(files_df['path_length'].mean())
+        self.scan_results['max_path_length'] = int(files_df['path_length'].max())
+        
+        # Keep the files DataFrame for the UI; it now holds every column, so
+        # the scan buffers are released rather than kept alive alongside it
         self.scan_results['files_df'] = files_df
+        self.scan_results['file_columns'] = self._new_file_columns()
         
         # Convert issues list to DataFrame for the UI
         if self.scan_results['issues']:
@@ -631,8 +1084,8 @@ class FileSystemScanner:
                 issues_df (pandas.DataFrame): DataFrame of identified issues
         """
         if 'files_df' not in self.scan_results:
-            if self.scan_results['files']:
-                self.scan_results['files_df'] = pd.DataFrame(self.scan_results['files'])
+            if self.scan_results['total_files']:
+                self.scan_results['files_df'] = self._build_files_df()
             else:
                 self.scan_results['files_df'] = pd.DataFrame()
         
@@ -7,6 +7,7 @@ Fixes illegal characters and reserved names in files and folders.
 """
 
 import os
+import re
 import logging
 import pandas as pd
 from pathlib import Path
@@ -37,6 +38,11 @@ class NameFixer:
              
         self.max_name_length = self.sharepoint_config.get('max_name_length', 128)
         
+        # Compile the illegal character class and reserved name set once
+        escaped_chars = ''.join(re.escape(char) for char in self.illegal_chars)
+        self._illegal_chars_pattern = re.compile(f"[{escaped_chars}]") if escaped_chars else None
+        self._reserved_names = frozenset(self.reserved_names)
+        
     def fix_name(self, original_name):
         """
         Fix a file or folder name to comply with SharePoint rules
@@ -50,10 +56,10 @@ class NameFixer:
         if not original_name:
             return "unnamed"
             
-        # Remove illegal characters
+        # Replace illegal characters
         fixed_name = original_name
-        for char in self.illegal_chars:
-            fixed_name = fixed_name.replace(char, "_")
+        if self._illegal_chars_pattern:
+            fixed_name = self._illegal_chars_pattern.sub("_", fixed_name)
             
         # Remove leading/trailing spaces
         fixed_name = fixed_name.strip()
@@ -63,7 +69,7 @@ class NameFixer:
         
         # Check if it's a reserved name
         name_without_ext, ext = os.path.splitext(fixed_name)
-        if name_without_ext.upper() in self.reserved_names:
+        if name_without_ext.upper() in self._reserved_names:
             name_without_ext = f"{name_without_ext}_SP"
             fixed_name = f"{name_without_ext}{ext}"
             
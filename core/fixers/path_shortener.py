@@ -8,11 +8,174 @@ Shortens paths that exceed SharePoint's path length limitations.
 
 import os
 import logging
+import numpy as np
 import pandas as pd
+from functools import lru_cache
 from pathlib import Path
 
 logger = logging.getLogger('sharepoint_migration_tool')
 
+@lru_cache(maxsize=4096)
+def _abbreviate_segment(part):
+    """
+    Abbreviate a single directory name (keep first 3 and last 3 characters)
+    
+    Directory names repeat heavily across a tree, so results are cached.
+    
+    Args:
+        part (str): Directory name to abbreviate
+        
+    Returns:
+        str: Abbreviated directory name
+    """
+    if len(part) > 8:
+        return f"{part[:3]}~{part[-3:]}"
+    return part
+
+def _strategy_abbreviate_dirs(original_path, target_root, drive, parts, file_name):
+    """
+    Strategy 1: Abbreviate directory names while preserving structure
+    
+    Args:
+        original_path (str): Original path to shorten
+        target_root (str, optional): Target root directory
+        drive (str): Drive component of the original path
+        parts (list): Directory components of the original path
+        file_name (str): File name of the original path
+    
+    Returns:
+        str: Shortened path with abbreviated directory names
+    """
+    # Abbreviate directory names, skipping empty parts
+    abbreviated_parts = [_abbreviate_segment(part) for part in parts if part]
+    
+    # Build the shortened path
+    if target_root:
+        # Use target root
+        result_path = os.path.join(target_root, *abbreviated_parts, file_name)
+    elif drive:
+        # Windows-style path with drive letter
+        result_path = os.path.join(drive + os.sep, *abbreviated_parts, file_name)
+    elif os.path.isabs(original_path):
+        # Unix-style absolute path
+        result_path = os.path.join(os.sep, *abbreviated_parts, file_name)
+    else:
+        # Relative path
+        result_path = os.path.join(*abbreviated_parts, file_name)
+    
+    return result_path
+
+def _strategy_remove_middle_dirs(original_path, target_root, drive, parts, file_name):
+    """
+    Strategy 2: Remove middle directories while preserving key parts
+    
+    Args:
+        original_path (str): Original path to shorten
+        target_root (str, optional): Target root directory
+        drive (str): Drive component of the original path
+        parts (list): Directory components of the original path
+        file_name (str): File name of the original path
+    
+    Returns:
+        str: Shortened path with middle directories removed
+    """
+    # Keep first and last directories, remove middle ones if there are more than 3 directories
+    if len(parts) > 3:
+        parts = [parts[0], "...", parts[-1]]
+    
+    # Build the shortened path
+    if target_root:
+        # Use target root
+        result_path = os.path.join(target_root, *parts, file_name)
+    elif drive:
+        # Windows-style path with drive letter
+        result_path = os.path.join(drive + os.sep, *parts, file_name)
+    elif os.path.isabs(original_path):
+        # Unix-style absolute path
+        result_path = os.path.join(os.sep, *parts, file_name)
+    else:
+        # Relative path
+        result_path = os.path.join(*parts, file_name)
+    
+    return result_path
+
+def _strategy_truncate_names(original_path, target_root, drive, parts, file_name):
+    """
+    Strategy 3: Truncate all names to a maximum length
+    
+    Args:
+        original_path (str): Original path to shorten
+        target_root (str, optional): Target root directory
+        drive (str): Drive component of the original path
+        parts (list): Directory components of the original path
+        file_name (str): File name of the original path
+    
+    Returns:
+        str: Shortened path with truncated names
+    """
+    # Split into name and extension
+    name, ext = os.path.splitext(file_name)
+    
+    # Truncate the filename if it's very long
+    if len(name) > 30:
+        file_name = f"{name[:27]}...{ext}"
+    
+    # Truncate directory names (max 10 characters)
+    truncated_parts = []
+    for part in parts:
+        # Skip empty parts
+        if not part:
+            continue
+    
+        # Truncate long directory names
+        if len(part) > 10:
+            truncated_parts.append(f"{part[:7]}...")
+        else:
+            truncated_parts.append(part)
+    
+    # Build the shortened path
+    if target_root:
+        # Use target root
+        result_path = os.path.join(target_root, *truncated_parts, file_name)
+    elif drive:
+        # Windows-style path with drive letter
+        result_path = os.path.join(drive + os.sep, *truncated_parts, file_name)
+    elif os.path.isabs(original_path):
+        # Unix-style absolute path
+        result_path = os.path.join(os.sep, *truncated_parts, file_name)
+    else:
+        # Relative path
+        result_path = os.path.join(*truncated_parts, file_name)
+    
+    return result_path
+
+def _strategy_minimal_path(original_path, target_root, drive, parts, file_name):
+    """
+    Strategy 4: Create a minimal path with just the necessary components
+    
+    Args:
+        original_path (str): Original path to shorten
+        target_root (str, optional): Target root directory
+        drive (str): Drive component of the original path
+        parts (list): Directory components of the original path
+        file_name (str): File name of the original path
+    
+    Returns:
+        str: Minimal path with just the filename
+    """
+    # Create a minimal path
+    if target_root:
+        # Use target root
+        result_path = os.path.join(target_root, "ShortPath", file_name)
+    elif drive:
+        # Windows-style path with drive letter
+        result_path = os.path.join(drive + os.sep, "ShortPath", file_name)
+    else:
+        # Unix-style path
+        result_path = os.path.join("ShortPath", file_name)
+    
+    return result_path
+
 class PathShortener:
     """Shortens paths that exceed SharePoint's length limitations"""
     
@@ -29,12 +192,12 @@ class PathShortener:
         self.sharepoint_config = self.config.get('sharepoint', {})
         self.max_path_length = self.sharepoint_config.get('max_path_length', 256)
         
-        # Configure shortening strategies
+        # Configure shortening strategies (module-level functions so they pickle)
         self.strategies = [
-            self._strategy_abbreviate_dirs,
-            self._strategy_remove_middle_dirs,
-            self._strategy_truncate_names,
-            self._strategy_minimal_path
+            _strategy_abbreviate_dirs,
+            _strategy_remove_middle_dirs,
+            _strategy_truncate_names,
+            _strategy_minimal_path
         ]
         
     def shorten_path(self, original_path, target_root=None):
@@ -61,140 +224,34 @@ class PathShortener:
             else:
                 return original_path
                 
+        # Split the path once and share the pieces with every strategy
+        drive, parts, file_name = self._split_path(original_path)
+        
         # Try each strategy in order until one works
         for strategy in self.strategies:
-            shortened_path = strategy(original_path, target_root)
+            shortened_path = strategy(original_path, target_root, drive, parts, file_name)
             if len(shortened_path) <= self.max_path_length:
                 return shortened_path
                 
         # If all strategies fail, return a minimal path
-        file_name = os.path.basename(original_path)
         if target_root:
             return os.path.join(target_root, file_name)
         else:
-            drive = os.path.splitdrive(original_path)[0]
             return os.path.join(drive + os.sep if drive else "", file_name)
             
-    def _strategy_abbreviate_dirs(self, original_path, target_root=None):
-        """
-        Strategy 1: Abbreviate directory names while preserving structure
-        
-        Args:
-            original_path (str): Original path to shorten
-            target_root (str, optional): Target root directory
-            
-        Returns:
-            str: Shortened path with abbreviated directory names
-        """
-        path_obj = Path(original_path)
-        file_name = path_obj.name
-        
-        # Preserve the drive or root
-        drive = os.path.splitdrive(original_path)[0]
-        
-        # Get the directory parts (excluding drive and filename)
-        if drive:
-            # Windows-style path with drive letter
-            parts = list(path_obj.parts)[1:-1]  # Exclude drive and filename
-        else:
-            # Unix-style path
-            parts = list(path_obj.parts)[1:-1] if path_obj.parts[0] == '/' else list(path_obj.parts)[:-1]
-            
-        # Abbreviate directory names
-        abbreviated_parts = []
-        for part in parts:
-            # Skip empty parts
-            if not part:
-                continue
-                
-            # Abbreviate long directory names (keep first 3 and last 3 characters)
-            if len(part) > 8:
-                abbreviated_parts.append(f"{part[:3]}~{part[-3:]}")
-            else:
-                abbreviated_parts.append(part)
-                
-        # Build the shortened path
-        if target_root:
-            # Use target root
-            result_path = os.path.join(target_root, *abbreviated_parts, file_name)
-        elif drive:
-            # Windows-style path with drive letter
-            result_path = os.path.join(drive + os.sep, *abbreviated_parts, file_name)
-        elif path_obj.is_absolute():
-            # Unix-style absolute path
-            result_path = os.path.join(os.sep, *abbreviated_parts, file_name)
-        else:
-            # Relative path
-            result_path = os.path.join(*abbreviated_parts, file_name)
-            
-        return result_path
-        
-    def _strategy_remove_middle_dirs(self, original_path, target_root=None):
-        """
-        Strategy 2: Remove middle directories while preserving key parts
-        
-        Args:
-            original_path (str): Original path to shorten
-            target_root (str, optional): Target root directory
-            
-        Returns:
-            str: Shortened path with middle directories removed
-        """
-        path_obj = Path(original_path)
-        file_name = path_obj.name
-        
-        # Preserve the drive or root
-        drive = os.path.splitdrive(original_path)[0]
-        
-        # Get the directory parts (excluding drive and filename)
-        if drive:
-            # Windows-style path with drive letter
-            parts = list(path_obj.parts)[1:-1]  # Exclude drive and filename
-        else:
-            # Unix-style path
-            parts = list(path_obj.parts)[1:-1] if path_obj.parts[0] == '/' else list(path_obj.parts)[:-1]
-            
-        # Keep first and last directories, remove middle ones if there are more than 3 directories
-        if len(parts) > 3:
-            parts = [parts[0], "...", parts[-1]]
-            
-        # Build the shortened path
-        if target_root:
-            # Use target root
-            result_path = os.path.join(target_root, *parts, file_name)
-        elif drive:
-            # Windows-style path with drive letter
-            result_path = os.path.join(drive + os.sep, *parts, file_name)
-        elif path_obj.is_absolute():
-            # Unix-style absolute path
-            result_path = os.path.join(os.sep, *parts, file_name)
-        else:
-            # Relative path
-            result_path = os.path.join(*parts, file_name)
-            
-        return result_path
-        
-    def _strategy_truncate_names(self, original_path, target_root=None):
+    def _split_path(self, original_path):
         """
-        Strategy 3: Truncate all names to a maximum length
+        Split a path into the pieces used by the shortening strategies
         
         Args:
-            original_path (str): Original path to shorten
-            target_root (str, optional): Target root directory
+            original_path (str): Original path to split
             
         Returns:
-            str: Shortened path with truncated names
+            tuple: (drive, directory parts, file name)
         """
         path_obj = Path(original_path)
-        
-        # Split into name and extension
         file_name = path_obj.name
-        name, ext = os.path.splitext(file_name)
         
-        # Truncate the filename if it's very long
-        if len(name) > 30:
-            file_name = f"{name[:27]}...{ext}"
-            
         # Preserve the drive or root
         drive = os.path.splitdrive(original_path)[0]
         
@@ -206,64 +263,7 @@ class PathShortener:
             # Unix-style path
             parts = list(path_obj.parts)[1:-1] if path_obj.parts[0] == '/' else list(path_obj.parts)[:-1]
             
-        # Truncate directory names (max 10 characters)
-        truncated_parts = []
-        for part in parts:
-            # Skip empty parts
-            if not part:
-                continue
-                
-            # Truncate long directory names
-            if len(part) > 10:
-                truncated_parts.append(f"{part[:7]}...")
-            else:
-                truncated_parts.append(part)
-                
-        # Build the shortened path
-        if target_root:
-            # Use target root
-            result_path = os.path.join(target_root, *truncated_parts, file_name)
-        elif drive:
-            # Windows-style path with drive letter
-            result_path = os.path.join(drive + os.sep, *truncated_parts, file_name)
-        elif path_obj.is_absolute():
-            # Unix-style absolute path
-            result_path = os.path.join(os.sep, *truncated_parts, file_name)
-        else:
-            # Relative path
-            result_path = os.path.join(*truncated_parts, file_name)
-            
-        return result_path
-        
-    def _strategy_minimal_path(self, original_path, target_root=None):
-        """
-        Strategy 4: Create a minimal path with just the necessary components
-        
-        Args:
-            original_path (str): Original path to shorten
-            target_root (str, optional): Target root directory
-            
-        Returns:
-            str: Minimal path with just the filename
-        """
-        # Get just the filename
-        file_name = os.path.basename(original_path)
-        
-        # Preserve the drive or root
-        drive = os.path.splitdrive(original_path)[0]
-        
-        # Create a minimal path
-        if target_root:
-            # Use target root
-            result_path = os.path.join(target_root, "ShortPath", file_name)
-        elif drive:
-            # Windows-style path with drive letter
-            result_path = os.path.join(drive + os.sep, "ShortPath", file_name)
-        else:
-            # Unix-style path
-            result_path = os.path.join("ShortPath", file_name)
-            
-        return result_path
+        return drive, parts, file_name
         
     def apply_fixes(self, issues_df, target_root=None):
         """
@@ -283,28 +283,39 @@ class PathShortener:
         # Create a copy to avoid modifying the original
         result_df = issues_df.copy()
         
-        # Add columns for the shortened path
-        if 'shortened_path' not in result_df.columns:
-            result_df['shortened_path'] = None
-            
-        # Apply fixes to each file
-        for index, row in result_df.iterrows():
-            original_path = row['path']
+        # Pull the columns out once instead of indexing every row
+        paths = np.asarray(result_df['path'].values, dtype=object)
+        suggested = result_df['suggested_path'].values if 'suggested_path' in result_df.columns else None
+        shortened_paths = np.empty(len(paths), dtype=object)
+        to_shorten = []
+        
+        # Use suggested paths where they are provided
+        for i in range(len(paths)):
+            suggested_path = suggested[i] if suggested is not None else None
             
-            # If a suggested path is already provided, use it
-            if 'suggested_path' in row and row['suggested_path']:
-                shortened_path = row['suggested_path']
+            if pd.notna(suggested_path) and suggested_path:
+                shortened_path = suggested_path
                 
                 # If target_root is provided, adjust the path
                 if target_root:
                     # Extract just the filename if we can't determine the relative path
                     file_name = os.path.basename(shortened_path)
                     shortened_path = os.path.join(target_root, file_name)
+                    
+                shortened_paths[i] = shortened_path
             else:
-                # Otherwise, apply shortening strategy
-                shortened_path = self.shorten_path(original_path, target_root)
+                to_shorten.append(i)
                 
-            result_df.at[index, 'shortened_path'] = shortened_path
+        # Shorten the remaining paths once each, in sorted order so sibling
+        # files hit the cached directory abbreviations back to back
+        if to_shorten:
+            unique_paths, inverse = np.unique(paths[to_shorten], return_inverse=True)
+            shortened_unique = np.empty(len(unique_paths), dtype=object)
+            for j, original_path in enumerate(unique_paths):
+                shortened_unique[j] = self.shorten_path(original_path, target_root)
+            shortened_paths[to_shorten] = shortened_unique[inverse]
+            
+        result_df['shortened_path'] = shortened_paths
             
         logger.info(f"Shortened {len(result_df)} file paths")
         return result_df
@@ -319,31 +330,27 @@ class PathShortener:
         Returns:
             pandas.DataFrame: DataFrame with original and shortened paths
         """
-        # Create a preview DataFrame
-        preview_df = pd.DataFrame(columns=['original_path', 'original_length', 'shortened_path', 'shortened_length'])
-        
         if issues_df is None or len(issues_df) == 0:
-            return preview_df
+            return pd.DataFrame(columns=['original_path', 'original_length', 'shortened_path', 'shortened_length'])
             
-        # Generate preview for each file
-        for index, row in issues_df.iterrows():
-            original_path = row['path']
-            original_length = len(original_path)
+        # Fill preallocated arrays by index rather than growing the DataFrame
+        n = len(issues_df)
+        original_paths = np.asarray(issues_df['path'].values, dtype=object)
+        suggested = issues_df['suggested_path'].values if 'suggested_path' in issues_df.columns else None
+        shortened_paths = np.empty(n, dtype=object)
+        
+        for i in range(n):
+            suggested_path = suggested[i] if suggested is not None else None
             
             # Get shortened path
-            if 'suggested_path' in row and row['suggested_path']:
-                shortened_path = row['suggested_path']
+            if pd.notna(suggested_path) and suggested_path:
+                shortened_paths[i] = suggested_path
             else:
-                shortened_path = self.shorten_path(original_path)
+                shortened_paths[i] = self.shorten_path(original_paths[i])
                 
-            shortened_length = len(shortened_path)
-            
-            # Add to preview
-            preview_df = preview_df.append({
-                'original_path': original_path,
-                'original_length': original_length,
-                'shortened_path': shortened_path,
-                'shortened_length': shortened_length
-            }, ignore_index=True)
-            
-        return preview_df
\ No newline at end of file
+        return pd.DataFrame({
+            'original_path': original_paths,
+            'original_length': np.fromiter((len(p) for p in original_paths), dtype=np.int32, count=n),
+            'shortened_path': shortened_paths,
+            'shortened_length': np.fromiter((len(p) for p in shortened_paths), dtype=np.int32, count=n)
+        })
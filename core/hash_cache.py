@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Optional on-disk cache of file content hashes for repeated scans.
+
+Rows are keyed on path and hash algorithm and only reused while the file's
+size, modification time and inode are unchanged, so edited or replaced files
+are rehashed.
+"""
+
+import sqlite3
+import logging
+
+logger = logging.getLogger('sharepoint_migration_tool')
+
+# Number of rows written per transaction
+BATCH_SIZE = 1000
+
+def _signed(value):
+    """Map an unsigned 64-bit inode number onto SQLite's signed INTEGER range"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+class HashCache:
+    """SQLite-backed store of file hashes keyed on file identity"""
+    
+    def __init__(self, cache_path, algorithm='md5'):
+        """
+        Open (or create) the cache database.
+        
+        Args:
+            cache_path (str): Path to the SQLite database file
+            algorithm (str): Name of the hash algorithm; hashes stored under
+                another algorithm are never returned
+        """
+        self.cache_path = cache_path
+        self.algorithm = algorithm
+        self.connection = sqlite3.connect(cache_path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS hashes("
+            "path TEXT, algorithm TEXT, size INTEGER, mtime_ns INTEGER, inode INTEGER, hash TEXT, "
+            "PRIMARY KEY(path, algorithm))"
+        )
+        self._pending = []
+    
+    def get(self, path, size, mtime_ns, inode):
+        """
+        Look up the cached hash of a file.
+        
+        Args:
+            path (str): Full path to the file
+            size (int): File size in bytes
+            mtime_ns (int): Modification time in nanoseconds
+            inode (int): Inode (file index) number
+        
+        Returns:
+            str: The cached hash, or None if there is no valid entry
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT hash FROM hashes WHERE path=? AND algorithm=? AND size=? AND mtime_ns=? AND inode=?",
+                (path, self.algorithm, size, mtime_ns, _signed(inode))
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read hash cache %s: %s", self.cache_path, e)
+            return None
+        return row[0] if row else None
+    
+    def put(self, path, size, mtime_ns, inode, file_hash):
+        """
+        Queue a hash to be stored; rows are written in batches.
+        
+        Args:
+            path (str): Full path to the file
+            size (int): File size in bytes
+            mtime_ns (int): Modification time in nanoseconds
+            inode (int): Inode (file index) number
+            file_hash (str): Hash of the file contents
+        """
+        self._pending.append((path, self.algorithm, size, mtime_ns, _signed(inode), file_hash))
+        if len(self._pending) >= BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Write queued rows in a single transaction."""
+        if not self._pending:
+            return
+        try:
+            with self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO hashes(path, algorithm, size, mtime_ns, inode, hash) VALUES (?, ?, ?, ?, ?, ?)",
+                    self._pending
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not write hash cache %s: %s", self.cache_path, e)
+        self._pending = []
+    
+    def close(self):
+        """Flush queued rows and close the database."""
+        self.flush()
+        self.connection.close()
@@ -1,8 +1,248 @@
 from PyQt5.QtCore import QThread, pyqtSignal
 import os
-import pandas as pd
+import sys
+import logging
+import threading
+import ctypes
+import re
+import struct
+import concurrent.futures
+from array import array
+from collections import Counter, OrderedDict, defaultdict
 import time
-import hashlib
+
+logger = logging.getLogger(__name__)
+
+# Minimum time between progress signals, in seconds
+PROGRESS_INTERVAL = 0.05
+
+# Upper bounds of the path_length_distribution buckets
+PATH_LENGTH_BINS = (50, 100, 150, 200, 250, 300)
+
+# getattrlistbulk(2) constants from <sys/attr.h> and <sys/vnode.h>
+ATTR_BIT_MAP_COUNT = 5
+ATTR_CMN_NAME = 0x00000001
+ATTR_CMN_OBJTYPE = 0x00000008
+ATTR_CMN_ERROR = 0x20000000
+ATTR_CMN_RETURNED_ATTRS = 0x80000000
+ATTR_FILE_DATALENGTH = 0x00000200
+VDIR = 2
+BULK_BUFFER_SIZE = 256 * 1024
+
+# SharePoint naming rules, matching the defaults in utils/config.py
+ILLEGAL_CHARS = frozenset('\\/:*?"<>|#%&{}+~=')
+ILLEGAL_CHARS_TABLE = str.maketrans('', '', ''.join(ILLEGAL_CHARS))
+RESERVED_NAMES = frozenset({
+    'CON', 'PRN', 'AUX', 'NUL',
+    'COM1', 'COM2', 'COM3', 'COM4', 'COM5', 'COM6', 'COM7', 'COM8', 'COM9',
+    'LPT1', 'LPT2', 'LPT3', 'LPT4', 'LPT5', 'LPT6', 'LPT7', 'LPT8', 'LPT9'
+})
+
+# Names in a directory are screened together, joined by NUL (which no file
+# name can contain); this matches any name whose stem is a reserved name
+RESERVED_NAMES_PATTERN = re.compile(
+    r'(?:^|\0)(?:' + '|'.join(sorted(RESERVED_NAMES)) + r')(?:\.[^.\0]*)?(?=\0|$)',
+    re.IGNORECASE
+)
+
+# Lower-cased form of each extension suffix seen so far, as used by _file_extension
+MAX_CACHED_EXTENSIONS = 4096
+_EXTENSIONS = {}
+
+# Where scandir accepts a directory descriptor, DirEntry.stat() becomes an
+# fstatat() relative to it instead of resolving the full path from the root
+SCANDIR_FD = os.scandir in os.supports_fd
+
+# Directory listings kept between scans in this process, at most this many
+MAX_CACHED_LISTINGS = 50000
+
+# Directories modified this recently (in nanoseconds) are not cached: a change
+# within the same mtime tick as the listing would go unnoticed
+RACY_MTIME_NS = 2 * 10**9
+
+class _ListingCache:
+    """
+    LRU cache of directory entry names, valid while the directory's mtime is
+    unchanged
+    
+    Adding, removing or renaming an entry updates its directory's mtime, so a
+    matching mtime means the same names. File sizes can change without
+    touching the directory, so they are not cached.
+    """
+    
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, directory, mtime_ns):
+        """Return the cached (subdir_names, file_names) for directory, or None"""
+        with self._lock:
+            cached = self._entries.get(directory)
+            if cached is None or cached[0] != mtime_ns:
+                return None
+            self._entries.move_to_end(directory)
+            return cached[1], cached[2]
+    
+    def put(self, directory, mtime_ns, subdir_names, file_names):
+        """Store a listing unless the directory changed too recently to trust its mtime"""
+        if time.time_ns() - mtime_ns < RACY_MTIME_NS:
+            return
+        with self._lock:
+            self._entries[directory] = (mtime_ns, tuple(subdir_names), tuple(file_names))
+            self._entries.move_to_end(directory)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+_listing_cache = _ListingCache(MAX_CACHED_LISTINGS)
+
+class _AttrList(ctypes.Structure):
+    _fields_ = [
+        ('bitmapcount', ctypes.c_ushort),
+        ('reserved', ctypes.c_uint16),
+        ('commonattr', ctypes.c_uint32),
+        ('volattr', ctypes.c_uint32),
+        ('dirattr', ctypes.c_uint32),
+        ('fileattr', ctypes.c_uint32),
+        ('forkattr', ctypes.c_uint32),
+    ]
+
+# On macOS getattrlistbulk returns names, types and sizes for many entries per
+# syscall; os.scandir there needs an lstat() per file. Windows and Linux
+# scandir already get this from FindFirstFile/getdents, so they keep using it.
+_getattrlistbulk = None
+if sys.platform == 'darwin':
+    try:
+        _getattrlistbulk = ctypes.CDLL(None, use_errno=True).getattrlistbulk
+        _getattrlistbulk.argtypes = [ctypes.c_int, ctypes.POINTER(_AttrList), ctypes.c_void_p,
+                                     ctypes.c_size_t, ctypes.c_uint64]
+        _getattrlistbulk.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _getattrlistbulk = None
+
+def _file_extension(file_name):
+    """
+    Lower-cased extension of a file name, matching os.path.splitext
+    
+    Lower-cased extensions are shared through _EXTENSIONS, so the many files
+    with the same extension reference one string instead of each allocating
+    its own copy.
+    """
+    dot = file_name.rfind('.')
+    # Only names starting with dots can have nothing but dots before the last one
+    if dot > 0 and (file_name[0] != '.' or file_name[:dot].lstrip('.')):
+        suffix = file_name[dot:]
+        ext = _EXTENSIONS.get(suffix)
+        if ext is None:
+            ext = suffix.lower()
+            if len(_EXTENSIONS) < MAX_CACHED_EXTENSIONS:
+                _EXTENSIONS[suffix] = ext
+        return ext
+    return ""
+
+def _parse_bulk_entries(buf, count, prefix, subdirs, files):
+    """Unpack count getattrlistbulk records from buf into subdirs and files; prefix is the directory path ending in a separator"""
+    offset = 0
+    for _ in range(count):
+        length, common, _vol, _dir, file_attrs, _fork = struct.unpack_from('=6I', buf, offset)
+        pos = offset + 24
+        error = 0
+        if common & ATTR_CMN_ERROR:
+            error = struct.unpack_from('=I', buf, pos)[0]
+            pos += 4
+        if not common & ATTR_CMN_NAME:
+            offset += length
+            continue
+        name_offset, name_length = struct.unpack_from('=iI', buf, pos)
+        name = os.fsdecode(buf[pos + name_offset:pos + name_offset + name_length - 1])
+        pos += 8
+        obj_type = 0
+        if common & ATTR_CMN_OBJTYPE:
+            obj_type = struct.unpack_from('=I', buf, pos)[0]
+            pos += 4
+        
+        path = prefix + name
+        if obj_type == VDIR:
+            subdirs.append((path, name))
+        else:
+            file_size = 0
+            if not error and file_attrs & ATTR_FILE_DATALENGTH:
+                file_size = struct.unpack_from('=q', buf, pos)[0]
+            files[0].append(path)
+            files[1].append(name)
+            files[2].append(file_size)
+        offset += length
+
+def _list_directory_bulk(directory):
+    """
+    List a directory with getattrlistbulk(2) (macOS only)
+    
+    Returns:
+        tuple: (subdirs, files) in the same form as Scanner._list_directory
+    """
+    attrs = _AttrList(bitmapcount=ATTR_BIT_MAP_COUNT,
+                      commonattr=ATTR_CMN_RETURNED_ATTRS | ATTR_CMN_NAME | ATTR_CMN_OBJTYPE | ATTR_CMN_ERROR,
+                      fileattr=ATTR_FILE_DATALENGTH)
+    buf = ctypes.create_string_buffer(BULK_BUFFER_SIZE)
+    subdirs = []
+    files = ([], [], array('q'))
+    # Joined once here; each entry's path is then a single concatenation
+    prefix = directory if directory.endswith(os.sep) else directory + os.sep
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        while True:
+            count = _getattrlistbulk(fd, ctypes.byref(attrs), buf, BULK_BUFFER_SIZE, 0)
+            if count < 0:
+                errno = ctypes.get_errno()
+                raise OSError(errno, os.strerror(errno), directory)
+            if count == 0:
+                break
+            _parse_bulk_entries(buf.raw, count, prefix, subdirs, files)
+    finally:
+        os.close(fd)
+    return subdirs, files
+
+class FileEntry:
+    """
+    One file in file_structure
+    
+    A slotted object is a fraction of the size of the dict per file it
+    replaces; entries are still read like that dict (entry['path'],
+    'size' in entry, entry.get('issues', [])) so existing views work as is.
+    """
+    __slots__ = ('path', 'name', 'size', 'extension', 'path_length')
+    
+    # Keys readable through the mapping interface, including derived ones
+    KEYS = ('path', 'name', 'size', 'extension', 'path_length', 'has_issues', 'issue_count')
+    
+    def __init__(self, path, name, size, extension, path_length):
+        self.path = path
+        self.name = name
+        self.size = size
+        self.extension = extension
+        self.path_length = path_length
+    
+    @property
+    def has_issues(self):
+        return self.path_length > 256  # SharePoint path length limit
+    
+    @property
+    def issue_count(self):
+        return 1 if self.has_issues else 0
+    
+    def __getitem__(self, key):
+        if key not in FileEntry.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key):
+        return key in FileEntry.KEYS
+    
+    def get(self, key, default=None):
+        return getattr(self, key) if key in FileEntry.KEYS else default
+    
+    def keys(self):
+        return FileEntry.KEYS
 
 class Scanner(QThread):
     """
@@ -13,14 +253,24 @@ class Scanner(QThread):
     scan_completed = pyqtSignal(dict)        # results
     error_occurred = pyqtSignal(str)         # error message
     
-    def __init__(self, source_folder):
+    def __init__(self, source_folder, max_workers=None, ignore_cache=False):
         super().__init__()
         self.source_folder = source_folder
+        self.max_workers = max_workers
+        # Rescans reuse the names of unchanged directories unless told not to
+        self.ignore_cache = ignore_cache
+        self._stop_event = threading.Event()
+    
+    def requestInterruption(self):
+        """Ask the scan to stop; the listing threads see this as well"""
+        self._stop_event.set()
+        super().requestInterruption()
         
     def run(self):
         """Main scanning method that runs in a separate thread"""
         try:
-            # Initialize results structure
+            # Initialize results structure; the issue and type tallies are
+            # defaultdicts while scanning and plain dicts once analyzed
             results = {
                 'root_directory': self.source_folder,
                 'total_files': 0,
@@ -28,9 +278,10 @@ class Scanner(QThread):
                 'total_size': 0,
                 'total_issues': 0,
                 'file_structure': {},
-                'path_length_issues': {},
-                'illegal_characters': {},
-                'reserved_names': {},
+                'file_columns': {},
+                'path_length_issues': defaultdict(list),
+                'illegal_characters': defaultdict(list),
+                'reserved_names': defaultdict(list),
                 'duplicates': {},
                 'avg_path_length': 0,
                 'max_path_length': 0,
@@ -56,119 +307,124 @@ class Scanner(QThread):
     def _scan_directory(self, directory, results):
         """Recursively scan a directory and collect file/folder information"""
         try:
-            # Keep track of files in this directory
-            results['file_structure'][directory] = {
-                'files': [],
-                'folders': []
+            # File and folder information is stored column-wise; parent_idx
+            # columns point into folder_paths, whose first entry is the root
+            columns = {
+                'paths': [],
+                'names': [],
+                'sizes': array('q'),
+                'exts': [],
+                'path_lengths': array('i'),
+                'parent_idx': array('i'),
+                'folder_paths': [directory],
+                'folder_names': [os.path.basename(directory)],
+                'folder_path_lengths': array('i', [len(directory)]),
+                'folder_parent_idx': array('i', [-1])
             }
+            results['file_columns'] = columns
+            
+            paths = columns['paths']
+            names = columns['names']
+            sizes = columns['sizes']
+            exts = columns['exts']
+            file_path_lengths = columns['path_lengths']
+            parent_idx = columns['parent_idx']
+            folder_paths = columns['folder_paths']
+            folder_names = columns['folder_names']
+            folder_path_lengths = columns['folder_path_lengths']
+            folder_parent_idx = columns['folder_parent_idx']
+            
+            stop_event = self._stop_event
             
             # Count files and folders
             file_count = 0
-            path_lengths = []
-            
-            for root, dirs, files in os.walk(directory):
-                # Process folders
-                for dir_name in dirs:
-                    dir_path = os.path.join(root, dir_name)
-                    results['total_folders'] += 1
-                    path_len = len(dir_path)
-                    path_lengths.append(path_len)
-                    
-                    # Check path length
-                    if path_len > 256:  # SharePoint path length limit
-                        if path_len not in results['path_length_issues']:
-                            results['path_length_issues'][path_len] = []
-                        results['path_length_issues'][path_len].append({
-                            'path': dir_path,
-                            'name': dir_name,
-                            'type': 'folder'
-                        })
-                        results['total_issues'] += 1
-                    
-                    # Add to file structure
-                    parent_dir = os.path.dirname(dir_path)
-                    if parent_dir in results['file_structure']:
-                        folder_info = {
-                            'path': dir_path,
-                            'name': dir_name,
-                            'path_length': path_len
-                        }
-                        results['file_structure'][parent_dir]['folders'].append(folder_info)
-                
-                # Process files
-                for file_name in files:
-                    file_path = os.path.join(root, file_name)
-                    
-                    # Get basic file info
-                    try:
-                        file_size = os.path.getsize(file_path)
-                        file_ext = os.path.splitext(file_name)[1].lower()
-                    except:
-                        file_size = 0
-                        file_ext = ""
-                    
-                    # Track file types
-                    if file_ext not in results['file_types']:
-                        results['file_types'][file_ext] = 0
-                    results['file_types'][file_ext] += 1
-                    
-                    # Update path length stats
-                    path_len = len(file_path)
-                    path_lengths.append(path_len)
-                    
-                    # Check path length
-                    file_has_issues = False
-                    if path_len > 256:  # SharePoint path length limit
-                        if path_len not in results['path_length_issues']:
-                            results['path_length_issues'][path_len] = []
-                        results['path_length_issues'][path_len].append({
-                            'path': file_path,
-                            'name': file_name,
-                            'type': 'file'
-                        })
-                        file_has_issues = True
-                        results['total_issues'] += 1
-                    
-                    # Update totals
-                    results['total_files'] += 1
-                    results['total_size'] += file_size
+            listed_folders = 0
+            last_progress = 0.0
+            
+            # Directory listings run on a thread pool so scandir/stat calls
+            # overlap; results are accounted for here, on the scanner thread
+            max_workers = self.max_workers or min(32, (os.cpu_count() or 1) * 4)
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+                pending = {executor.submit(self._list_directory, directory): 0}
+                while pending:
+                    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
                     
-                    # Add to file structure
-                    parent_dir = os.path.dirname(file_path)
-                    if parent_dir in results['file_structure']:
-                        file_info = {
-                            'path': file_path,
-                            'name': file_name,
-                            'size': file_size,
-                            'extension': file_ext,
-                            'path_length': path_len,
-                            'has_issues': file_has_issues,
-                            'issue_count': 1 if file_has_issues else 0
-                        }
-                        results['file_structure'][parent_dir]['files'].append(file_info)
+                    for future in done:
+                        root_idx = pending.pop(future)
+                        listed_folders += 1
+                        try:
+                            subdirs, files = future.result()
+                        except OSError as e:
+                            # Unreadable directories are skipped, as os.walk does
+                            logger.warning(f"Could not scan directory {folder_paths[root_idx]}: {str(e)}")
+                            continue
+                        
+                        # Process folders: add them to the folder columns and
+                        # queue their listings, then screen their names the
+                        # same way as the files'. Path lengths of both are
+                        # checked in one pass after the walk
+                        for dir_path, dir_name in subdirs:
+                            pending[executor.submit(self._list_directory, dir_path)] = len(folder_paths)
+                            folder_paths.append(dir_path)
+                            folder_names.append(dir_name)
+                            folder_path_lengths.append(len(dir_path))
+                            folder_parent_idx.append(root_idx)
+                        if subdirs:
+                            results['total_folders'] += len(subdirs)
+                            self._check_names(results, folder_paths[-len(subdirs):], folder_names[-len(subdirs):], 'folder')
+                        
+                        # Process files a directory at a time: the listing
+                        # arrives as parallel columns that are extended in
+                        # bulk, and file types are counted after the walk
+                        dir_paths, dir_names, dir_sizes = files
+                        if not dir_paths:
+                            continue
+                        dir_exts = list(map(_file_extension, dir_names))
+                        dir_path_lengths = array('i', map(len, dir_paths))
+                        
+                        # Check names
+                        self._check_names(results, dir_paths, dir_names, 'file')
+                        
+                        # Update totals
+                        results['total_files'] += len(dir_paths)
+                        
+                        # Add to file columns
+                        paths.extend(dir_paths)
+                        names.extend(dir_names)
+                        sizes.extend(dir_sizes)
+                        exts.extend(dir_exts)
+                        file_path_lengths.extend(dir_path_lengths)
+                        parent_idx.extend(array('i', [root_idx]) * len(dir_paths))
+                        
+                        # Update progress, at most once per PROGRESS_INTERVAL seconds
+                        file_count += len(dir_paths)
+                        now = time.monotonic()
+                        if now - last_progress >= PROGRESS_INTERVAL:
+                            last_progress = now
+                            # Estimate the total by assuming folders still to be
+                            # listed hold as many files as those listed so far
+                            self.progress_updated.emit(file_count, file_count * len(folder_paths) // listed_folders)
                     
-                    # Update progress
-                    file_count += 1
-                    if file_count % 10 == 0:  # Update every 10 files
-                        self.progress_updated.emit(file_count, 1000)  # Estimate 1000 files
-                
-                # Check for interruption
-                if self.isInterruptionRequested():
-                    return
-            
-            # Calculate path length statistics
-            if path_lengths:
-                results['avg_path_length'] = sum(path_lengths) // len(path_lengths)
-                results['max_path_length'] = max(path_lengths)
+                    # Check for interruption
+                    if stop_event.is_set():
+                        for future in pending:
+                            future.cancel()
+                        results['total_size'] = self._sum_sizes(sizes)
+                        self._record_path_length_issues(results, columns)
+                        return
+            
+            results['total_size'] = self._sum_sizes(sizes)
+            self._record_path_length_issues(results, columns)
+            
+            # Calculate path length statistics over every folder and file,
+            # straight from the length columns
+            path_lengths = self._path_lengths(columns)
+            if len(path_lengths):
+                results['avg_path_length'] = int(path_lengths.sum()) // len(path_lengths)
+                results['max_path_length'] = int(path_lengths.max())
             
             # Create path length distribution
-            distribution = {50: 0, 100: 0, 150: 0, 200: 0, 250: 0, 300: 0}
-            for length in path_lengths:
-                for bin_val in sorted(distribution.keys()):
-                    if length <= bin_val:
-                        distribution[bin_val] += 1
-                        break
-            results['path_length_distribution'] = distribution
+            results['path_length_distribution'] = self._path_length_distribution(path_lengths)
             
             # Final progress update
             self.progress_updated.emit(file_count, file_count)
@@ -176,55 +432,237 @@ class Scanner(QThread):
         except Exception as e:
             self.error_occurred.emit(f"Error scanning directory {directory}: {str(e)}")
     
+    def _sum_sizes(self, sizes):
+        """Total an array('q') of file sizes in one vectorised numpy call"""
+        import numpy as np
+        return int(np.frombuffer(sizes, dtype=np.int64).sum())
+    
+    def _path_lengths(self, columns):
+        """Return the path lengths of all scanned folders and files, excluding the root, as one int32 array"""
+        import numpy as np
+        return np.concatenate((
+            np.frombuffer(columns['folder_path_lengths'], dtype=np.int32)[1:],
+            np.frombuffer(columns['path_lengths'], dtype=np.int32)
+        ))
+    
+    def _path_length_distribution(self, path_lengths):
+        """
+        Count path lengths into the 50-character distribution buckets
+        
+        Each bucket counts lengths up to and including its key and above the
+        previous key; lengths over 300 are not counted.
+        """
+        import numpy as np
+        # digitize(right=True) matches the inclusive upper bounds, which
+        # np.histogram's half-open bins would not
+        bins = np.array(PATH_LENGTH_BINS)
+        bucket = np.digitize(np.asarray(path_lengths, dtype=np.int32), bins, right=True)
+        counts = np.bincount(bucket, minlength=len(bins) + 1)[:len(bins)]
+        return dict(zip(PATH_LENGTH_BINS, counts.tolist()))
+    
+    def _record_path_length_issues(self, results, columns):
+        """
+        Record every folder and file whose path exceeds the SharePoint limit
+        
+        The comparison runs once over the collected path length columns with
+        numpy, so the scan loop itself carries no per-item length branch.
+        """
+        import numpy as np
+        path_length_issues = results['path_length_issues']
+        
+        # The first folder entry is the scan root, which is not checked
+        for item_type, item_paths, item_names, item_lengths, start in (
+                ('folder', columns['folder_paths'], columns['folder_names'], columns['folder_path_lengths'], 1),
+                ('file', columns['paths'], columns['names'], columns['path_lengths'], 0)):
+            lengths = np.frombuffer(item_lengths, dtype=np.int32)
+            issue_idx = np.nonzero(lengths[start:] > 256)[0] + start  # SharePoint path length limit
+            for i in issue_idx.tolist():
+                path_length_issues[int(lengths[i])].append({
+                    'path': item_paths[i],
+                    'name': item_names[i],
+                    'type': item_type
+                })
+            results['total_issues'] += len(issue_idx)
+    
+    def _list_directory(self, directory):
+        """
+        List a single directory; runs on the traversal thread pool
+        
+        DirEntry caches the file type, so one stat() call per file is enough,
+        and it is made relative to an open descriptor of the directory where
+        the platform allows it. On macOS the listing comes from getattrlistbulk
+        instead, which returns sizes along with the names.
+        
+        Elsewhere, directories whose mtime matches an earlier scan in this
+        process are not read again; only their files are stat()ed for
+        current sizes.
+        
+        Returns:
+            tuple: (subdirs, files) where subdirs holds (path, name) pairs and
+                files is a (paths, names, sizes) tuple of parallel columns
+        """
+        # Listings still queued when the scan is interrupted are skipped
+        if self._stop_event.is_set():
+            return [], ([], [], array('q'))
+        
+        if _getattrlistbulk is not None:
+            return _list_directory_bulk(directory)
+        
+        subdirs = []
+        file_paths = []
+        file_names = []
+        file_sizes = array('q')
+        prefix = directory if directory.endswith(os.sep) else directory + os.sep
+        fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY) if SCANDIR_FD else None
+        try:
+            mtime_ns = (os.stat(directory) if fd is None else os.fstat(fd)).st_mtime_ns
+            if not self.ignore_cache:
+                cached = _listing_cache.get(directory, mtime_ns)
+                if cached is not None:
+                    try:
+                        return self._list_cached_directory(prefix, fd, *cached)
+                    except OSError:
+                        pass  # A file went away mid-scan; read the directory again
+            
+            with os.scandir(directory if fd is None else fd) as it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                    except OSError:
+                        is_dir = False
+                    
+                    if is_dir:
+                        subdirs.append((prefix + name, name))
+                    else:
+                        try:
+                            file_size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            file_size = 0
+                        file_paths.append(prefix + name)
+                        file_names.append(name)
+                        file_sizes.append(file_size)
+            
+            _listing_cache.put(directory, mtime_ns, [name for _, name in subdirs], file_names)
+        finally:
+            if fd is not None:
+                os.close(fd)
+        return subdirs, (file_paths, file_names, file_sizes)
+    
+    def _list_cached_directory(self, prefix, fd, subdir_names, file_names):
+        """Rebuild a listing from cached names, stat()ing each file for its current size"""
+        if fd is None:
+            file_sizes = array('q', [os.stat(prefix + name, follow_symlinks=False).st_size for name in file_names])
+        else:
+            file_sizes = array('q', [os.stat(name, dir_fd=fd, follow_symlinks=False).st_size for name in file_names])
+        subdirs = [(prefix + name, name) for name in subdir_names]
+        return subdirs, ([prefix + name for name in file_names], list(file_names), file_sizes)
+    
+    def _check_names(self, results, paths, names, item_type):
+        """
+        Record illegal characters and reserved names among one directory's
+        folders or files
+        
+        All names are screened at once; only a batch with a possible hit is
+        checked name by name.
+        """
+        joined_names = '\0'.join(names)
+        if (joined_names.translate(ILLEGAL_CHARS_TABLE) == joined_names
+                and not RESERVED_NAMES_PATTERN.search(joined_names)):
+            return
+        
+        for path, name in zip(paths, names):
+            if name.translate(ILLEGAL_CHARS_TABLE) != name:
+                self._record_illegal_characters(results, path, name, item_type)
+            stem_len = len(name) - len(_file_extension(name))
+            if stem_len <= 4 and name[:stem_len].upper() in RESERVED_NAMES:
+                self._record_reserved_name(results, path, name, stem_len, item_type)
+    
+    def _record_illegal_characters(self, results, path, name, item_type):
+        """Add an entry under each SharePoint-illegal character found in name"""
+        for char in ILLEGAL_CHARS.intersection(name):
+            results['illegal_characters'][char].append({
+                'path': path,
+                'name': name,
+                'type': item_type
+            })
+            results['total_issues'] += 1
+    
+    def _record_reserved_name(self, results, path, name, stem_len, item_type):
+        """Add an entry for a name whose stem is a reserved system name"""
+        results['reserved_names'][name[:stem_len].upper()].append({
+            'path': path,
+            'name': name,
+            'type': item_type
+        })
+        results['total_issues'] += 1
+    
     def _analyze_results(self, results):
         """Analyze scan results to detect potential issues"""
-        # This is where we would call various analyzers to detect issues
-        # For now, we've already collected path length issues during scanning
-        
-        # Count total issues
-        total_issues = 0
-        for length, files in results['path_length_issues'].items():
-            total_issues += len(files)
-        for char, files in results['illegal_characters'].items():
-            total_issues += len(files)
-        for name, files in results['reserved_names'].items():
-            total_issues += len(files)
+        # Path length, illegal character and reserved name issues are
+        # collected and counted during scanning
         for hash_val, files in results['duplicates'].items():
-            total_issues += len(files) - 1  # Count all but the first file
-            
-        results['total_issues'] = total_issues
+            results['total_issues'] += len(files) - 1  # Count all but the first file
+        
+        # Count file types over the whole extension column in one C-level pass
+        results['file_types'] = dict(Counter(results['file_columns'].get('exts', ())))
+        
+        # Hand plain dicts to the UI so lookups there cannot add empty entries
+        for key in ('path_length_issues', 'illegal_characters', 'reserved_names'):
+            results[key] = dict(results[key])
+    
+    def _build_file_structure(self, results):
+        """Build the per-directory file_structure view of every scanned folder"""
+        columns = results['file_columns']
+        folder_paths = columns['folder_paths']
+        
+        # One bucket per folder, addressed by the folder's index; entries are
+        # appended through their parent index, so no parent path is derived
+        # or looked up and no subfolder is dropped
+        buckets = [{'files': [], 'folders': []} for _ in folder_paths]
+        
+        folder_parent_idx = columns['folder_parent_idx']
+        folder_names = columns['folder_names']
+        folder_path_lengths = columns['folder_path_lengths']
+        for i in range(1, len(folder_paths)):
+            buckets[folder_parent_idx[i]]['folders'].append({
+                'path': folder_paths[i],
+                'name': folder_names[i],
+                'path_length': folder_path_lengths[i]
+            })
+        
+        for parent, path, name, size, ext, path_len in zip(columns['parent_idx'], columns['paths'], columns['names'],
+                                                           columns['sizes'], columns['exts'], columns['path_lengths']):
+            buckets[parent]['files'].append(FileEntry(path, name, size, ext, path_len))
+        
+        results['file_structure'] = dict(zip(folder_paths, buckets))
     
     def _prepare_dataframe(self, results):
         """Prepare a DataFrame from the file information for easier UI display"""
-        # Collect all files into a flat list
-        files = []
-        for dir_path, dir_data in results['file_structure'].items():
-            for file_info in dir_data['files']:
-                files.append(file_info)
-        
-        # Convert to DataFrame
-        if files:
-            df = pd.DataFrame(files)
-            
-            # Add path_length column if not present
-            if 'path_length' not in df.columns:
-                df['path_length'] = df['path'].apply(len)
-                
-            # Add has_issues column if not present
-            if 'has_issues' not in df.columns:
-                df['has_issues'] = False
-                for _, path_issues in results['path_length_issues'].items():
-                    for issue in path_issues:
-                        if 'path' in issue:
-                            df.loc[df['path'] == issue['path'], 'has_issues'] = True
-                
-            # Add issue_count column if not present
-            if 'issue_count' not in df.columns:
-                df['issue_count'] = 0
-                for _, path_issues in results['path_length_issues'].items():
-                    for issue in path_issues:
-                        if 'path' in issue:
-                            df.loc[df['path'] == issue['path'], 'issue_count'] += 1
+        columns = results.get('file_columns')
+        if not columns:
+            return
+        
+        # Keep the nested view of the root directory for tree-based widgets
+        self._build_file_structure(results)
+        
+        # Convert the columns to a DataFrame without per-file dicts
+        if columns['paths']:
+            import pandas as pd
+            
+            # Extensions repeat heavily, so store them as a categorical, and
+            # keep the numeric columns at the narrowest dtype that fits
+            path_lengths = pd.Series(columns['path_lengths'], dtype='int32')
+            has_issues = path_lengths > 256
+            df = pd.DataFrame({
+                'path': columns['paths'],
+                'name': columns['names'],
+                'size': pd.Series(columns['sizes'], dtype='int64'),
+                'extension': pd.Categorical(columns['exts']),
+                'path_length': path_lengths,
+                'has_issues': has_issues,
+                'issue_count': has_issues.astype('int16')
+            }, copy=False)
             
             # Store DataFrame in results
             results['files_df'] = df
@@ -245,4 +683,9 @@ class Scanner(QThread):
             
             if issues:
                 results['issues'] = issues
-                results['issues_df'] = pd.DataFrame(issues)
\ No newline at end of file
+                results['issues_df'] = pd.DataFrame(issues)
+        
+        # files_df and file_structure now hold everything the UI reads, so the
+        # scan buffers are released instead of keeping a second copy alive
+        # for as long as the results are
+        del results['file_columns']
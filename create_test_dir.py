@@ -113,22 +113,26 @@ def create_long_path_files(base_dir, complexity):
     # Create a deep directory structure
     depth = 10 if complexity == 'simple' else 20 if complexity == 'normal' else 30
     
-    current_dir = long_path_dir
+    # Keep the current directory joined with a trailing separator, so each
+    # child path is one concatenation rather than an os.path.join call
+    sep = os.sep
+    prefix = long_path_dir + sep
     for i in range(depth):
-        current_dir = os.path.join(current_dir, f"level_{i:02d}_with_somewhat_long_directory_name")
+        current_dir = prefix + f"level_{i:02d}_with_somewhat_long_directory_name"
         os.makedirs(current_dir, exist_ok=True)
+        prefix = current_dir + sep
         
         # Add files at each level
-        with open(os.path.join(current_dir, f"file_at_level_{i}.txt"), "w") as f:
+        with open(prefix + f"file_at_level_{i}.txt", "w") as f:
             f.write(f"This file is at depth level {i}")
             
     # Create a file with a very long name at the deepest level
     long_filename = "extremely_" + "long_" * 20 + "filename.txt"
-    with open(os.path.join(current_dir, long_filename), "w") as f:
+    longest_path = prefix + long_filename
+    with open(longest_path, "w") as f:
         f.write("This file has a very long name")
         
-    # Calculate and print the longest path
-    longest_path = os.path.join(current_dir, long_filename)
+    # Print the longest path
     print(f"Created long path files. Longest path is {len(longest_path)} characters: {longest_path}")
 
 def create_duplicate_files(base_dir, complexity):
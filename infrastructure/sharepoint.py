@@ -3,26 +3,29 @@ SharePoint Integration Module for Migration Tool
 Provides functionality for authentication, data cleaning and automatic upload to SharePoint
 """
 
+import hashlib
 import logging
+import mmap
 import os
-import shutil
+import sqlite3
 import tempfile
+import threading
+import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# office365 is imported on sign-in rather than here, so the rest of the
+# tool starts without loading it
+
 try:
-    from office365.runtime.auth.authentication_context import AuthenticationContext
-    from office365.sharepoint.client_context import ClientContext
-    from office365.sharepoint.files.file import File
-    from office365.sharepoint.folders.folder import Folder
-except ImportError as e:
-    logger.critical(f"Failed to import SharePoint dependencies: {e}")
-    logger.critical(traceback.format_exc())
-    raise
+    import xxhash
+except ImportError:
+    xxhash = None
 
 try:
     from core.data_cleaner import DataCleaner
@@ -30,19 +33,67 @@ try:
     from core.analyzers.path_analyzer import PathAnalyzer
     from core.fixers.name_fixer import NameFixer
     from core.fixers.path_shortener import PathShortener
+    from infrastructure.upload_manifest import UploadManifest, file_digest
+    from utils.fs_cleanup import remove_tree
 except ImportError as e:
     logger.critical(f"Failed to import core components: {e}")
     logger.critical(traceback.format_exc())
     raise
 
+# Maps local path separators onto the '/' of SharePoint URLs
+SEP_TO_SLASH = str.maketrans(os.sep, '/')
+
+# Files sent per REST $batch request
+UPLOAD_BATCH_SIZE = 20
+
+# Upper bound on the bytes read into memory for one $batch request
+UPLOAD_BATCH_BYTES = 8 * 1024 * 1024
+
+# Files larger than this are streamed through an upload session
+LARGE_FILE_THRESHOLD = 4 * 1024 * 1024
+
+# Chunk size of upload sessions
+UPLOAD_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Concurrent upload requests
+UPLOAD_WORKERS = 8
+
+# Retries of a throttled (429/503) upload
+MAX_UPLOAD_RETRIES = 5
+
+def _content_digest(path: str) -> bytes:
+    """
+    Hash a file's contents for duplicate detection, reading it through mmap
+    
+    Args:
+        path: Local path of a non-empty file
+        
+    Returns:
+        bytes: xxh3-128 digest, or a 16-byte BLAKE2b digest without xxhash
+    """
+    with open(path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if xxhash is not None:
+                return xxhash.xxh3_128_digest(data)
+            return hashlib.blake2b(data, digest_size=16).digest()
+
 class SharePointIntegration:
     """
     Handles authentication, data cleaning, and uploading to SharePoint
     """
     
-    def __init__(self):
+    def __init__(self, manifest_path: Optional[str] = None):
+        """
+        Args:
+            manifest_path: SQLite file recording uploaded files, so unchanged
+                files are skipped on later uploads; None uploads every file
+        """
         try:
+            self.manifest_path = manifest_path
             self.ctx = None  # SharePoint context
+            self.auth_context = None  # Shared by the upload workers' contexts
+            self._known_folders = set()  # Folder URLs known to exist on the site
+            self._document_libraries = None  # Cached by get_document_libraries
             self.site_url = None
             self.temp_dir = None  # Temporary directory for cleaned files
             self.data_cleaner = DataCleaner()
@@ -65,12 +116,18 @@ class SharePointIntegration:
             bool: True if authentication successful, False otherwise
         """
         try:
+            from office365.runtime.auth.authentication_context import AuthenticationContext
+            from office365.sharepoint.client_context import ClientContext
+            
             auth_context = AuthenticationContext(site_url)
             success = auth_context.acquire_token_for_user(username, password)
             
             if success:
                 self.ctx = ClientContext(site_url, auth_context)
+                self.auth_context = auth_context
                 self.site_url = site_url
+                self._known_folders = set()
+                self._document_libraries = None
                 logger.info(f"Successfully authenticated to {site_url}")
                 return True
             else:
@@ -94,12 +151,18 @@ class SharePointIntegration:
             bool: True if authentication successful, False otherwise
         """
         try:
+            from office365.runtime.auth.authentication_context import AuthenticationContext
+            from office365.sharepoint.client_context import ClientContext
+            
             auth_context = AuthenticationContext(site_url)
             success = auth_context.acquire_token_for_app(client_id, client_secret)
             
             if success:
                 self.ctx = ClientContext(site_url, auth_context)
+                self.auth_context = auth_context
                 self.site_url = site_url
+                self._known_folders = set()
+                self._document_libraries = None
                 logger.info(f"Successfully authenticated to {site_url} using app-only auth")
                 return True
             else:
@@ -191,6 +254,7 @@ class SharePointIntegration:
             "total_files": 0,
             "uploaded_files": 0,
             "failed_files": 0,
+            "skipped_files": 0,
             "total_size_bytes": 0
         }
         
@@ -231,7 +295,7 @@ class SharePointIntegration:
         finally:
             # Clean up the temporary directory
             if self.temp_dir and os.path.exists(self.temp_dir):
-                shutil.rmtree(self.temp_dir)
+                remove_tree(self.temp_dir)
     
     def upload_directory(self, local_dir: str, target_library: str) -> Tuple[bool, List[str], Dict]:
         """
@@ -268,6 +332,7 @@ class SharePointIntegration:
             "total_files": 0,
             "uploaded_files": 0,
             "failed_files": 0,
+            "skipped_files": 0,
             "total_size_bytes": 0
         }
         
@@ -276,44 +341,102 @@ class SharePointIntegration:
             return False, issues, stats
             
         try:
-            # Ensure target library exists
-            target_folder = self.ctx.web.get_folder_by_server_relative_url(target_library)
-            self.ctx.load(target_folder)
-            self.ctx.execute_query()
-            
-            # Process all files and directories recursively
-            for root, dirs, files in os.walk(local_dir):
-                for file in files:
-                    local_file_path = os.path.join(root, file)
+            # Ensure target library exists; only throttling is retried
+            try:
+                self._call_with_retry(self.ctx, self._load_folder, self.ctx, target_library)
+            except Exception as e:
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status != 404:
+                    raise
+                logger.error(f"Target library not found: {target_library}")
+                issues.append(f"Target library not found: {target_library}")
+                return False, issues, stats
+                
+            self._known_folders.add(target_library)
+            
+            # Collect the files and the folders they go into
+            work = []  # (relative path, local path, folder URL, file name, size)
+            
+            for rel_dir, files in self._walk_files(local_dir):
+                if rel_dir:
+                    folder_url = f"{target_library}/{rel_dir.translate(SEP_TO_SLASH)}"
+                    rel_prefix = rel_dir + os.sep
+                else:
+                    folder_url = target_library
+                    rel_prefix = ''
                     
+                for entry in files:
                     # Calculate the relative path from the source directory
-                    rel_path = os.path.relpath(local_file_path, local_dir)
-                    target_file_path = f"{target_library}/{rel_path.replace(os.sep, '/')}"
+                    rel_path = rel_prefix + entry.name
                     
-                    # Upload the file
                     try:
                         stats["total_files"] += 1
-                        file_size = os.path.getsize(local_file_path)
+                        file_size = entry.stat().st_size
                         stats["total_size_bytes"] += file_size
-                        
-                        with open(local_file_path, 'rb') as file_content:
-                            file_content_bytes = file_content.read()
-                            
-                        # Create parent folders if needed
-                        self._ensure_folders_exist(target_file_path)
-                        
-                        # Upload the file
-                        File.save_binary(self.ctx, target_file_path, file_content_bytes)
-                        self.ctx.execute_query()
-                        
-                        logger.info(f"Uploaded: {rel_path} -> {target_file_path}")
-                        stats["uploaded_files"] += 1
+                        work.append((rel_path, entry.path, folder_url, entry.name, file_size))
                         
                     except Exception as e:
                         logger.error(f"Failed to upload {rel_path}: {str(e)}")
                         issues.append(f"Failed to upload {rel_path}: {str(e)}")
                         stats["failed_files"] += 1
                         
+            manifest = None
+            if self.manifest_path:
+                try:
+                    manifest = UploadManifest(self.manifest_path)
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not open upload manifest {self.manifest_path}: {str(e)}")
+                    
+            try:
+                # Skip files whose bytes were already uploaded to the same path
+                digests = {}
+                if manifest:
+                    remaining = []
+                    for item in work:
+                        rel_path, local_file_path, folder_url, file, file_size = item
+                        try:
+                            digest = file_digest(local_file_path)
+                        except OSError:
+                            remaining.append(item)
+                            continue
+                            
+                        if manifest.contains(self.site_url, f"{folder_url}/{file}", file_size, digest):
+                            logger.info(f"Unchanged, skipped: {rel_path}")
+                            stats["skipped_files"] += 1
+                        else:
+                            digests[local_file_path] = digest
+                            remaining.append(item)
+                    work = remaining
+                    
+                # Upload each distinct content once; the other copies are made on the server
+                work, duplicates = self._split_duplicates(work, digests)
+                
+                # Create every target folder once, before any file is uploaded
+                failed_folders = self._ensure_folders({item[2] for item in work} |
+                                                      {item[2] for item, _ in duplicates})
+                
+                if failed_folders:
+                    for rel_path, _, folder_url, _, _ in work + [item for item, _ in duplicates]:
+                        if folder_url in failed_folders:
+                            logger.error(f"Failed to upload {rel_path}: folder {folder_url} could not be created")
+                            issues.append(f"Failed to upload {rel_path}: folder {folder_url} could not be created")
+                            stats["failed_files"] += 1
+                    work = [item for item in work if item[2] not in failed_folders]
+                    duplicates = [(item, source) for item, source in duplicates
+                                  if item[2] not in failed_folders]
+                    
+                uploaded = self._run_upload_jobs(work, issues, stats, manifest, digests)
+                
+                # Duplicates whose source did not upload are sent themselves
+                self._copy_duplicates([(item, source) for item, source in duplicates if source[1] in uploaded],
+                                      issues, stats, manifest, digests)
+                self._run_upload_jobs([item for item, source in duplicates if source[1] not in uploaded],
+                                      issues, stats, manifest, digests)
+                
+            finally:
+                if manifest:
+                    manifest.close()
+                    
             success = stats["failed_files"] == 0
             return success, issues, stats
             
@@ -322,52 +445,419 @@ class SharePointIntegration:
             issues.append(f"Error accessing target library: {str(e)}")
             return False, issues, stats
             
-    def _ensure_folders_exist(self, file_path: str) -> None:
+    def _walk_files(self, local_dir: str) -> Iterator[Tuple[str, List[os.DirEntry]]]:
         """
-        Ensure all parent folders exist for a given file path
+        Walk a directory tree with os.scandir, like os.walk without following directory links
         
         Args:
-            file_path: SharePoint file path
+            local_dir: Local directory to walk
+            
+        Yields:
+            Tuple of the directory path relative to local_dir ('' for local_dir
+            itself) and the DirEntry objects of its files, for directories with files
         """
-        # Split the path into segments
-        path_parts = file_path.split('/')
+        stack = [('', local_dir)]
         
-        # Remove the file name (last part)
-        folder_parts = path_parts[:-1]
-        
-        if len(folder_parts) <= 1:
-            # File is in the root of the document library, no folders to create
-            return
+        while stack:
+            rel_dir, dir_path = stack.pop()
+            files = []
             
-        # Build the folder path incrementally and create each folder if it doesn't exist
-        current_path = folder_parts[0]  # Start with the document library
+            try:
+                with os.scandir(dir_path) as entries:
+                    for entry in entries:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                            
+                        if not is_dir:
+                            files.append(entry)
+                        elif not entry.is_symlink():
+                            stack.append((os.path.join(rel_dir, entry.name), entry.path))
+                            
+            except OSError as e:
+                logger.warning(f"Cannot read directory {dir_path}: {str(e)}")
+                continue
+                
+            if files:
+                yield rel_dir, files
+                
+    def _split_duplicates(self, work: List[Tuple],
+                          digests: Dict[str, str]) -> Tuple[List[Tuple], List[Tuple[Tuple, Tuple]]]:
+        """
+        Separate files whose content matches an earlier file in the upload
         
-        for i in range(1, len(folder_parts)):
-            current_path += f"/{folder_parts[i]}"
+        Only files that share their size with another file are compared, by
+        their manifest digest when they have one and otherwise by hashing them.
+        
+        Args:
+            work: (relative path, local path, folder URL, file name, size) entries
+            digests: Manifest digests already computed, keyed on local path
             
+        Returns:
+            Tuple containing:
+                List[Tuple]: Entries to upload
+                List[Tuple[Tuple, Tuple]]: (duplicate entry, entry with the same content) pairs
+        """
+        by_size = {}
+        for item in work:
+            if item[4] > 0:
+                by_size.setdefault(item[4], []).append(item)
+                
+        duplicates = []
+        for items in by_size.values():
+            if len(items) < 2:
+                continue
+                
+            first_by_digest = {}
+            for item in items:
+                # Manifest digests are hex strings and never equal a content digest
+                digest = digests.get(item[1])
+                if digest is None:
+                    try:
+                        digest = _content_digest(item[1])
+                    except (OSError, ValueError):
+                        continue
+                    
+                source = first_by_digest.setdefault(digest, item)
+                if source is not item:
+                    duplicates.append((item, source))
+                    
+        if duplicates:
+            duplicate_paths = {item[1] for item, _ in duplicates}
+            work = [item for item in work if item[1] not in duplicate_paths]
+            logger.info(f"{len(duplicates)} duplicate files will be copied on the server instead of uploaded")
+            
+        return work, duplicates
+        
+    def _copy_duplicates(self, duplicates: List[Tuple[Tuple, Tuple]], issues: List[str], stats: Dict,
+                         manifest: Optional[UploadManifest], digests: Dict[str, str]) -> None:
+        """
+        Create duplicate files by copying their already uploaded source on the server
+        
+        Args:
+            duplicates: (duplicate entry, uploaded entry with the same content) pairs
+            issues: List that failures are appended to
+            stats: Upload statistics to update
+            manifest: Manifest that copied files are recorded in, if any
+            digests: Content digests of the files to record, keyed on local path
+        """
+        for i in range(0, len(duplicates), UPLOAD_BATCH_SIZE):
+            chunk = duplicates[i:i + UPLOAD_BATCH_SIZE]
             try:
-                folder = self.ctx.web.get_folder_by_server_relative_url(current_path)
-                self.ctx.load(folder)
-                self.ctx.execute_query()
+                self._call_with_retry(self.ctx, self._send_copy_batch, self.ctx, chunk)
+                
+                for (rel_path, local_file_path, folder_url, file, file_size), source in chunk:
+                    logger.info(f"Copied: {source[2]}/{source[3]} -> {folder_url}/{file}")
+                    if local_file_path in digests:
+                        manifest.put(self.site_url, f"{folder_url}/{file}", file_size,
+                                     digests[local_file_path])
+                stats["uploaded_files"] += len(chunk)
                 
-                # Folder exists, continue
+            except Exception as e:
+                for (rel_path, *_), _ in chunk:
+                    logger.error(f"Failed to upload {rel_path}: {str(e)}")
+                    issues.append(f"Failed to upload {rel_path}: {str(e)}")
+                stats["failed_files"] += len(chunk)
+                
+    def _load_folder(self, ctx, folder_url: str) -> None:
+        """
+        Load a folder, raising if it does not exist
+        
+        Args:
+            ctx: Client context to query with
+            folder_url: Server relative folder URL
+        """
+        folder = ctx.web.get_folder_by_server_relative_url(folder_url)
+        ctx.load(folder)
+        ctx.execute_query()
+        
+    def _ensure_folder(self, ctx, folder_url: str) -> None:
+        """
+        Ensure a folder and its missing parents exist
+        
+        ensure_folder_path chains one request per path segment, each built
+        from its parent's response, so it is sent with execute_query rather
+        than queued into a $batch.
+        
+        Args:
+            ctx: Client context to create the folder with
+            folder_url: Server relative folder URL
+        """
+        ctx.web.ensure_folder_path(folder_url)
+        ctx.execute_query()
+        
+    def _send_copy_batch(self, ctx, chunk: List[Tuple[Tuple, Tuple]]) -> None:
+        """
+        Send server-side copies in a single $batch request
+        
+        Args:
+            ctx: Client context to copy with
+            chunk: (duplicate entry, uploaded entry with the same content) pairs
+        """
+        for (_, _, folder_url, file, _), (_, _, source_folder, source_file, _) in chunk:
+            source = ctx.web.get_file_by_server_relative_url(f"{source_folder}/{source_file}")
+            source.copyto(f"{folder_url}/{file}", True)
+            
+        ctx.execute_batch()
+        
+    def _run_upload_jobs(self, work: List[Tuple], issues: List[str], stats: Dict,
+                         manifest: Optional[UploadManifest], digests: Dict[str, str]) -> Set[str]:
+        """
+        Upload files on the worker pool and record the results
+        
+        Args:
+            work: (relative path, local path, folder URL, file name, size) entries
+            issues: List that failures are appended to
+            stats: Upload statistics to update
+            manifest: Manifest that uploaded files are recorded in, if any
+            digests: Content digests of the files to record, keyed on local path
+            
+        Returns:
+            Set[str]: Local paths of the files that were uploaded
+        """
+        uploaded = set()
+        
+        # Large files are uploaded on their own, small files in $batch requests.
+        # Batched files are held in memory, so batches are also capped by size.
+        jobs = []
+        batch = []
+        batch_bytes = 0
+        
+        for item in work:
+            file_size = item[4]
+            if file_size > LARGE_FILE_THRESHOLD:
+                jobs.append([item])
+                continue
+                
+            if batch and (len(batch) >= UPLOAD_BATCH_SIZE or batch_bytes + file_size > UPLOAD_BATCH_BYTES):
+                jobs.append(batch)
+                batch = []
+                batch_bytes = 0
+                
+            batch.append(item)
+            batch_bytes += file_size
+            
+        if batch:
+            jobs.append(batch)
+        
+        # Client contexts are not thread-safe, so each worker gets its own
+        contexts = threading.local()
+        
+        with ThreadPoolExecutor(max_workers=UPLOAD_WORKERS) as executor:
+            futures = {executor.submit(self._upload_job, contexts, job): job for job in jobs}
+            
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    failed = future.result()
+                except Exception as e:
+                    failed = {item[1]: str(e) for item in job}
+                    
+                for rel_path, local_file_path, folder_url, file, file_size in job:
+                    if local_file_path in failed:
+                        logger.error(f"Failed to upload {rel_path}: {failed[local_file_path]}")
+                        issues.append(f"Failed to upload {rel_path}: {failed[local_file_path]}")
+                        stats["failed_files"] += 1
+                        continue
+                        
+                    logger.info(f"Uploaded: {rel_path} -> {folder_url}/{file}")
+                    if local_file_path in digests:
+                        manifest.put(self.site_url, f"{folder_url}/{file}", file_size,
+                                     digests[local_file_path])
+                    uploaded.add(local_file_path)
+                    stats["uploaded_files"] += 1
+                    
+        return uploaded
+        
+    def _upload_job(self, contexts: threading.local, job: List[Tuple]) -> Dict[str, str]:
+        """
+        Upload one large file, or a list of small files in a single $batch request
+        
+        Runs on an upload worker thread. If a $batch request fails, the files
+        whose part of the response did not confirm the upload are sent again
+        one at a time, so only the files that fail on their own are reported.
+        
+        Args:
+            contexts: Thread-local holder of the worker's client context
+            job: (relative path, local path, folder URL, file name, size) entries
+            
+        Returns:
+            Dict[str, str]: Error messages of the files that failed, keyed on local path
+        """
+        ctx = getattr(contexts, "ctx", None)
+        if ctx is None:
+            from office365.sharepoint.client_context import ClientContext
+            ctx = contexts.ctx = ClientContext(self.site_url, self.auth_context)
+            
+        if len(job) == 1 and job[0][4] > LARGE_FILE_THRESHOLD:
+            _, local_file_path, folder_url, _, _ = job[0]
+            self._call_with_retry(ctx, self._upload_large_file, ctx, folder_url, local_file_path)
+            return {}
+            
+        results = []
+        try:
+            self._call_with_retry(ctx, self._send_upload_batch, ctx, job, results)
+            return {}
+        except Exception as e:
+            logger.warning(f"Upload batch failed, checking its files one by one: {str(e)}")
+            
+        # Parts after a failed one may not have been read from the response,
+        # so anything without a loaded result is sent again on its own
+        failed = {}
+        for i, item in enumerate(job):
+            if i < len(results) and results[i].is_property_available("ServerRelativeUrl"):
                 continue
                 
-            except Exception:
-                # Folder doesn't exist, create it
-                parent_path = '/'.join(folder_parts[:i])
-                folder_name = folder_parts[i]
+            try:
+                self._call_with_retry(ctx, self._send_upload_batch, ctx, [item], [])
+            except Exception as e:
+                failed[item[1]] = str(e)
+                
+        return failed
+        
+    def _call_with_retry(self, ctx, func, *args) -> None:
+        """
+        Call a SharePoint function, backing off while SharePoint throttles requests
+        
+        Args:
+            ctx: Client context the function queues its requests on
+            func: Function to call
+            *args: Arguments for the function
+        """
+        for attempt in range(MAX_UPLOAD_RETRIES + 1):
+            try:
+                func(*args)
+                return
+            except Exception as e:
+                # Drop the failed requests so they are not sent with later queries
+                ctx.clear()
+                
+                response = getattr(e, "response", None)
+                status = getattr(response, "status_code", None)
+                if status not in (429, 503) or attempt == MAX_UPLOAD_RETRIES:
+                    raise
+                    
+                # Honour Retry-After when SharePoint sends it
+                try:
+                    delay = float(response.headers.get("Retry-After"))
+                except (TypeError, ValueError):
+                    delay = 2 ** attempt
+                    
+                logger.warning(f"SharePoint returned {status}, retrying in {delay} seconds")
+                time.sleep(delay)
+                
+    def _upload_large_file(self, ctx, folder_url: str, local_file_path: str) -> None:
+        """
+        Upload a file in UPLOAD_CHUNK_SIZE chunks through an upload session
+        
+        Args:
+            ctx: Client context to upload with
+            folder_url: SharePoint folder to upload into
+            local_file_path: Local path of the file
+        """
+        target_dir = ctx.web.get_folder_by_server_relative_url(folder_url)
+        
+        with open(local_file_path, 'rb') as file_content:
+            # Widen kernel readahead so the next chunk is read while this one is sent
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(file_content.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
                 
-                parent_folder = self.ctx.web.get_folder_by_server_relative_url(parent_path)
-                parent_folder.folders.add(folder_name)
-                self.ctx.execute_query()
+            target_dir.files.create_upload_session(file_content, UPLOAD_CHUNK_SIZE)
+            ctx.execute_query()
+            
+    def _send_upload_batch(self, ctx, batch: List[Tuple], results: List) -> None:
+        """
+        Send small files to SharePoint in a single $batch request
+        
+        Args:
+            ctx: Client context to upload with
+            batch: (relative path, local path, folder URL, file name, size) entries
+            results: List that the File result of each queued upload is put in,
+                in batch order; kept if the request fails
+        """
+        results.clear()
+        
+        for _, local_file_path, folder_url, file, _ in batch:
+            with open(local_file_path, 'rb') as file_content:
+                file_content_bytes = file_content.read()
                 
-                logger.info(f"Created folder: {current_path}")
+            target_dir = ctx.web.get_folder_by_server_relative_url(folder_url)
+            results.append(target_dir.upload_file(file, file_content_bytes))
+            
+        ctx.execute_batch()
+        
+    def _ensure_folders(self, folder_urls: Set[str]) -> Set[str]:
+        """
+        Create any of the given folders that are not known to exist
+        
+        ensure_folder_path also creates missing parents, so only folders that
+        are not a parent of another pending folder are requested. Every prefix
+        of a created folder is then marked as known. When such a folder fails,
+        its pending parents are requested on their own, deepest first, so
+        files in those parents are not failed along with it.
+        
+        Args:
+            folder_urls: Server relative folder URLs
+            
+        Returns:
+            Set[str]: Folder URLs that could not be created
+        """
+        pending = {url for url in folder_urls if url not in self._known_folders}
+        prefixes = {}
+        parents = set()
+        
+        for folder_url in pending:
+            # Build each path prefix with a single join rather than by appending
+            parts = folder_url.split('/')
+            prefixes[folder_url] = ['/'.join(parts[:i]) for i in range(1, len(parts) + 1)]
+            parents.update(prefixes[folder_url][:-1])
+            
+        failed = set()
+        
+        for folder_url in sorted(pending - parents):
+            if self._try_ensure_folder(folder_url, prefixes[folder_url]):
+                continue
                 
-    def get_document_libraries(self) -> List[str]:
+            failed.add(folder_url)
+            for parent_url in reversed(prefixes[folder_url][:-1]):
+                if (parent_url in pending and parent_url not in self._known_folders
+                        and parent_url not in failed):
+                    if not self._try_ensure_folder(parent_url, prefixes[parent_url]):
+                        failed.add(parent_url)
+                        
+        return failed
+        
+    def _try_ensure_folder(self, folder_url: str, prefixes: List[str]) -> bool:
+        """
+        Ensure a folder exists and mark it and its parents as known
+        
+        Args:
+            folder_url: Server relative folder URL
+            prefixes: Every path prefix of folder_url, ending with folder_url itself
+            
+        Returns:
+            bool: True if the folder exists
+        """
+        try:
+            self._call_with_retry(self.ctx, self._ensure_folder, self.ctx, folder_url)
+        except Exception as e:
+            logger.error(f"Failed to create folder {folder_url}: {str(e)}")
+            return False
+            
+        self._known_folders.update(prefixes)
+        logger.info(f"Ensured folder: {folder_url}")
+        return True
+        
+    def get_document_libraries(self, refresh: bool = False) -> List[str]:
         """
         Get a list of document libraries in the SharePoint site
         
+        The list is cached until the next sign-in or disconnect.
+        
+        Args:
+            refresh: Reload the list from SharePoint instead of using the cache
+            
         Returns:
             List[str]: List of document library names
         """
@@ -375,17 +865,19 @@ class SharePointIntegration:
             logger.error("Not authenticated to SharePoint.")
             return []
             
+        if self._document_libraries is not None and not refresh:
+            return list(self._document_libraries)
+            
         try:
-            # Load all lists that are document libraries
-            lists = self.ctx.web.lists
-            self.ctx.load(lists, ["Title", "BaseTemplate"])
+            # Let SharePoint filter for document libraries (base template 101)
+            # and return only their titles
+            lists = self.ctx.web.lists.filter("BaseTemplate eq 101")
+            self.ctx.load(lists, ["Title"])
             self.ctx.execute_query()
             
-            # Filter for document libraries (base template 101)
-            doc_libraries = [lst.properties["Title"] for lst in lists 
-                            if lst.properties["BaseTemplate"] == 101]
+            self._document_libraries = [lst.properties["Title"] for lst in lists]
             
-            return doc_libraries
+            return list(self._document_libraries)
             
         except Exception as e:
             logger.error(f"Error getting document libraries: {str(e)}")
@@ -396,11 +888,14 @@ class SharePointIntegration:
         Disconnect from SharePoint and clean up resources
         """
         self.ctx = None
+        self.auth_context = None
         self.site_url = None
+        self._known_folders = set()
+        self._document_libraries = None
         
         # Clean up temporary directory if it exists
         if self.temp_dir and os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+            remove_tree(self.temp_dir)
             self.temp_dir = None
             
         logger.info("Disconnected from SharePoint")
\ No newline at end of file
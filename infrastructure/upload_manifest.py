@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Optional on-disk record of files already uploaded to SharePoint.
+
+Rows are keyed on site and target path and store the size and content
+digest of the uploaded file, so a later run can skip files whose bytes
+have not changed.
+"""
+
+import hashlib
+import sqlite3
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of rows written per transaction
+BATCH_SIZE = 1000
+
+# Bytes read per call when hashing a file
+READ_SIZE = 1024 * 1024
+
+def file_digest(path):
+    """
+    Compute the content digest stored in the manifest.
+    
+    Args:
+        path (str): Path to the file
+    
+    Returns:
+        str: Hex BLAKE2b digest (16 bytes) of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(READ_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class UploadManifest:
+    """SQLite-backed store of the files uploaded to each site"""
+    
+    def __init__(self, manifest_path):
+        """
+        Open (or create) the manifest database.
+        
+        Args:
+            manifest_path (str): Path to the SQLite database file
+        """
+        self.manifest_path = manifest_path
+        self.connection = sqlite3.connect(manifest_path, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS uploads("
+            "site_url TEXT, target_path TEXT, size INTEGER, digest TEXT, "
+            "PRIMARY KEY(site_url, target_path))"
+        )
+        self._pending = []
+    
+    def contains(self, site_url, target_path, size, digest):
+        """
+        Check whether identical bytes were already uploaded to a path.
+        
+        Args:
+            site_url (str): SharePoint site URL
+            target_path (str): Server relative path of the file
+            size (int): File size in bytes
+            digest (str): Digest from file_digest
+        
+        Returns:
+            bool: True if the manifest holds the same size and digest
+        """
+        try:
+            row = self.connection.execute(
+                "SELECT 1 FROM uploads WHERE site_url=? AND target_path=? AND size=? AND digest=?",
+                (site_url, target_path, size, digest)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning("Could not read upload manifest %s: %s", self.manifest_path, e)
+            return False
+        return row is not None
+    
+    def put(self, site_url, target_path, size, digest):
+        """
+        Queue an uploaded file to be recorded; rows are written in batches.
+        
+        Args:
+            site_url (str): SharePoint site URL
+            target_path (str): Server relative path of the file
+            size (int): File size in bytes
+            digest (str): Digest from file_digest
+        """
+        self._pending.append((site_url, target_path, size, digest))
+        if len(self._pending) >= BATCH_SIZE:
+            self.flush()
+    
+    def flush(self):
+        """Write queued rows in a single transaction."""
+        if not self._pending:
+            return
+        try:
+            with self.connection:
+                self.connection.execute("BEGIN")
+                self.connection.executemany(
+                    "INSERT OR REPLACE INTO uploads(site_url, target_path, size, digest) VALUES (?, ?, ?, ?)",
+                    self._pending
+                )
+        except sqlite3.Error as e:
+            logger.warning("Could not write upload manifest %s: %s", self.manifest_path, e)
+        self._pending = []
+    
+    def close(self):
+        """Flush queued rows and close the database."""
+        self.flush()
+        self.connection.close()
@@ -19,9 +19,6 @@ from pathlib import Path
 from PyQt5.QtWidgets import QApplication, QMessageBox
 from PyQt5.QtGui import QIcon
 
-# Import the main window class
-from ui.main_window import MainWindow
-
 logger = logging.getLogger(__name__)
 
 def main():
@@ -37,9 +34,15 @@ def main():
         
         # Set application stylesheet if available
         style_path = os.path.join(os.path.dirname(__file__), "resources", "styles", "app_style.qss")
-        if os.path.exists(style_path):
-            with open(style_path, "r") as style_file:
-                app.setStyleSheet(style_file.read())
+        try:
+            with open(style_path, "rb") as style_file:
+                app.setStyleSheet(style_file.read().decode("utf-8", errors="replace"))
+        except FileNotFoundError:
+            pass
+        
+        # Import the main window only now, so the application (and the error
+        # dialog below) exists while its modules load
+        from ui.main_window import MainWindow
         
         # Create and show main window
         main_window = MainWindow()
@@ -57,9 +57,11 @@ def main():
     
     # Set application stylesheet if available
     style_path = os.path.join(os.path.dirname(__file__), "resources", "styles", "app_style.qss")
-    if os.path.exists(style_path):
-        with open(style_path, "r") as style_file:
-            app.setStyleSheet(style_file.read())
+    try:
+        with open(style_path, "rb") as style_file:
+            app.setStyleSheet(style_file.read().decode("utf-8", errors="replace"))
+    except FileNotFoundError:
+        pass
     
     # Ensure resource directories exist
     resources_dir = os.path.join(os.path.dirname(__file__), "resources")
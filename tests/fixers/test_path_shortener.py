@@ -94,4 +94,54 @@ def test_path_shortening(long_paths_dir):
         
         # Verify drive letter is preserved if present
         if os.path.splitdrive(path)[0]:
-            assert os.path.splitdrive(shortened)[0] == os.path.splitdrive(path)[0], "Drive letter not preserved"
\ No newline at end of file
+            assert os.path.splitdrive(shortened)[0] == os.path.splitdrive(path)[0], "Drive letter not preserved"
+
+def test_real_path_shortener_strategies():
+    """Test that the real PathShortener brings long paths under the limit."""
+    from core.fixers.path_shortener import PathShortener
+    
+    shortener = PathShortener()
+    long_path = os.path.join(os.sep, *["very_long_directory_name_%02d" % i for i in range(12)], "report.docx")
+    assert len(long_path) > shortener.max_path_length
+    
+    shortened = shortener.shorten_path(long_path)
+    assert len(shortened) <= shortener.max_path_length
+    assert shortened.endswith("report.docx")
+    
+    # Short paths are returned unchanged
+    assert shortener.shorten_path("/tmp/report.docx") == "/tmp/report.docx"
+
+
+def test_real_path_shortener_apply_fixes():
+    """Test that apply_fixes honours suggested paths and shortens the rest."""
+    import pandas as pd
+    from core.fixers.path_shortener import PathShortener
+    
+    shortener = PathShortener()
+    long_path = os.path.join(os.sep, *["very_long_directory_name_%02d" % i for i in range(12)], "report.docx")
+    issues_df = pd.DataFrame({
+        'path': [long_path, "/tmp/already/short.txt"],
+        'suggested_path': [None, "/tmp/short.txt"],
+    })
+    
+    result_df = shortener.apply_fixes(issues_df)
+    
+    assert len(result_df) == 2
+    assert len(result_df['shortened_path'].iloc[0]) <= shortener.max_path_length
+    assert result_df['shortened_path'].iloc[1] == "/tmp/short.txt"
+    assert 'shortened_path' not in issues_df.columns
+
+
+def test_real_path_shortener_preview_fixes():
+    """Test that preview_fixes reports original and shortened lengths."""
+    import pandas as pd
+    from core.fixers.path_shortener import PathShortener
+    
+    shortener = PathShortener()
+    long_path = os.path.join(os.sep, *["very_long_directory_name_%02d" % i for i in range(12)], "report.docx")
+    preview_df = shortener.preview_fixes(pd.DataFrame({'path': [long_path]}))
+    
+    assert list(preview_df.columns) == ['original_path', 'original_length', 'shortened_path', 'shortened_length']
+    assert preview_df['original_length'].iloc[0] == len(long_path)
+    assert preview_df['shortened_length'].iloc[0] == len(preview_df['shortened_path'].iloc[0])
+    assert preview_df['shortened_length'].iloc[0] <= shortener.max_path_length
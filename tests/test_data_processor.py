@@ -4,6 +4,8 @@ import shutil
 import pytest
 from unittest.mock import MagicMock, patch
 
+from core.data_processor import DataProcessor
+
 class MockDataProcessor:
     """Mock implementation of data processor for testing."""
     
@@ -133,4 +135,30 @@ def test_data_processor_respects_options(test_dir, output_dir):
     results = processor.process(test_dir)
     
     # Verify no duplicates were detected
-    assert len(results['duplicates']) == 0, "Duplicates were detected despite being disabled"
\ No newline at end of file
+    assert len(results['duplicates']) == 0, "Duplicates were detected despite being disabled"
+
+def test_copy_file_keeps_sources_when_links_collide(tmp_path):
+    """Test that staging two sources onto one target path leaves both sources unchanged."""
+    first = tmp_path / "first.docx"
+    second = tmp_path / "second.docx"
+    first.write_bytes(b"first contents")
+    second.write_bytes(b"second contents")
+    dest = tmp_path / "staged.docx"
+    
+    processor = DataProcessor()
+    processor._link_files = processor._unlink_existing = True
+    processor._copy_file(str(first), str(dest), True)
+    processor._copy_file(str(second), str(dest), True)
+    
+    assert first.read_bytes() == b"first contents"
+    assert second.read_bytes() == b"second contents"
+    assert dest.read_bytes() == b"second contents"
+    
+    # Once links are unavailable, copying onto an earlier link must not write through it
+    processor._copy_file(str(first), str(dest), True)
+    processor._link_files = False
+    processor._copy_file(str(second), str(dest), True)
+    
+    assert first.read_bytes() == b"first contents"
+    assert second.read_bytes() == b"second contents"
+    assert dest.read_bytes() == b"second contents"
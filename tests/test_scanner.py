@@ -67,4 +67,104 @@ def test_scanner_captures_metadata(test_dir):
     # Verify metadata
     assert file_info is not None, f"File not found in scan results: {first_file}"
     assert file_info.name == os.path.basename(first_file)
-    assert file_info.size == os.path.getsize(first_file)
\ No newline at end of file
+    assert file_info.size == os.path.getsize(first_file)
+
+def test_file_system_scanner_counts(test_dir):
+    """Test that FileSystemScanner finds every file and folder in the test directory."""
+    from core.file_scanner import FileSystemScanner
+    
+    expected_files = 0
+    expected_folders = 0
+    expected_size = 0
+    for root, dirs, files in os.walk(test_dir):
+        expected_folders += len(dirs)
+        expected_files += len(files)
+        expected_size += sum(os.path.getsize(os.path.join(root, f)) for f in files)
+    
+    results = FileSystemScanner().scan_directory(test_dir)
+    
+    assert results is not None
+    assert len(results['files_df']) == expected_files
+    assert results['total_folders'] == expected_folders
+    assert results['total_size'] == expected_size
+
+def test_file_system_scanner_flags_duplicates(duplicates_dir):
+    """Test that every copy beyond the first of identical content is flagged."""
+    from core.file_scanner import FileSystemScanner
+    
+    results = FileSystemScanner().scan_directory(duplicates_dir)
+    
+    hashes = results['files_df']['hash'].dropna().tolist()
+    expected = len(hashes) - len(set(hashes))
+    duplicate_issues = [i for i in results['issues'] if i['issue_type'] == 'Duplicate File']
+    assert expected > 0
+    assert len(duplicate_issues) == expected
+
+def test_file_system_scanner_hashes_only_shared_sizes(tmp_path):
+    """Test that only files sharing their size with another file are hashed."""
+    from core.file_scanner import FileSystemScanner
+    
+    (tmp_path / "a.txt").write_text("same")
+    (tmp_path / "b.txt").write_text("same")
+    (tmp_path / "unique.txt").write_text("a different length")
+    
+    files_df = FileSystemScanner().scan_directory(str(tmp_path))['files_df']
+    hashed = dict(zip(files_df['filename'], files_df['hash'].notna()))
+    assert hashed == {'a.txt': True, 'b.txt': True, 'unique.txt': False}
+
+def test_file_system_scanner_skips_files_with_unique_prefix(tmp_path):
+    """Test that same-sized files are only hashed in full when their first bytes match."""
+    from core.file_scanner import FileSystemScanner, PREFIX_HASH_SIZE
+    
+    size = PREFIX_HASH_SIZE + 100
+    (tmp_path / "a.bin").write_bytes(b"a" * size)
+    (tmp_path / "b.bin").write_bytes(b"a" * (size - 1) + b"b")
+    (tmp_path / "c.bin").write_bytes(b"c" * size)
+    
+    results = FileSystemScanner().scan_directory(str(tmp_path))
+    hashed = dict(zip(results['files_df']['filename'], results['files_df']['hash'].notna()))
+    assert hashed == {'a.bin': True, 'b.bin': True, 'c.bin': False}
+    assert not [i for i in results['issues'] if i['issue_type'] == 'Duplicate File']
+
+def test_file_system_scanner_reuses_cached_hashes(tmp_path, monkeypatch):
+    """Test that a second scan with a hash cache does not rehash unchanged files."""
+    import core.file_scanner as file_scanner
+    
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    (data_dir / "a.txt").write_text("same")
+    (data_dir / "b.txt").write_text("same")
+    cache_path = str(tmp_path / "hashes.sqlite")
+    
+    first = file_scanner.FileSystemScanner(cache_path=cache_path).scan_directory(str(data_dir))
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("file was rehashed")
+    monkeypatch.setattr(file_scanner, '_hash_file', fail)
+    second = file_scanner.FileSystemScanner(cache_path=cache_path).scan_directory(str(data_dir))
+    
+    assert second['files_df']['hash'].tolist() == first['files_df']['hash'].tolist()
+    assert second['total_issues'] == first['total_issues'] == 1
+
+def test_scanner_reuses_listing_of_unchanged_directory(tmp_path, monkeypatch):
+    """Test that an unchanged directory is not read again but its file sizes are current."""
+    import core.scanner as scanner_module
+    
+    (tmp_path / "a.txt").write_text("one")
+    old_ns = (os.stat(tmp_path).st_mtime_ns // 10**9 - 60) * 10**9
+    os.utime(tmp_path, ns=(old_ns, old_ns))
+    
+    scanner = scanner_module.Scanner(str(tmp_path))
+    scanner._list_directory(str(tmp_path))
+    (tmp_path / "a.txt").write_text("longer")
+    
+    def fail(*args, **kwargs):
+        raise AssertionError("directory was read again")
+    with monkeypatch.context() as m:
+        m.setattr(scanner_module.os, 'scandir', fail)
+        _, (_, names, sizes) = scanner._list_directory(str(tmp_path))
+    assert names == ['a.txt'] and list(sizes) == [6]
+    
+    (tmp_path / "b.txt").write_text("two")
+    _, (_, names, _) = scanner._list_directory(str(tmp_path))
+    assert sorted(names) == ['a.txt', 'b.txt']
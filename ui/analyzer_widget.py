@@ -172,6 +172,7 @@ class AnalyzerWidget(QWidget):
         header.setSectionResizeMode(2, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
         header.setSectionResizeMode(4, QHeaderView.ResizeToContents)
+        header.setResizeContentsPrecision(64)  # Widths from a sample of rows
         
         # Add to layout
         layout.addWidget(self.issues_table)
@@ -4,9 +4,9 @@ This module provides a data view with basic sorting, filtering, and export capab
 """
 
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                             QTableView, QLineEdit, QComboBox, 
+                             QTableView, QLineEdit,
                              QPushButton, QLabel, QFileDialog, 
-                             QHeaderView, QMessageBox, QApplication)
+                             QHeaderView, QMessageBox)
 from PyQt5.QtCore import Qt, QSortFilterProxyModel, QRegExp
 from PyQt5.QtGui import QStandardItemModel, QStandardItem
 import pandas as pd
@@ -55,6 +55,7 @@ class EnhancedDataView(QWidget):
         self.table_view.setAlternatingRowColors(True)
         self.table_view.setSelectionBehavior(QTableView.SelectRows)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        self.table_view.horizontalHeader().setResizeContentsPrecision(64)  # Measure a sample, not every row
         self.table_view.verticalHeader().setVisible(False)
         main_layout.addWidget(self.table_view)
         
@@ -97,20 +98,23 @@ class EnhancedDataView(QWidget):
             
         self.df = data_frame
         
-        # Clear existing model
-        self.model.clear()
-        
         # Set headers
         headers = data_frame.columns.tolist()
-        self.model.setHorizontalHeaderLabels(headers)
-        
-        # Populate the model with data
-        for row_idx, row in data_frame.iterrows():
-            items = []
-            for value in row:
-                item = QStandardItem(str(value))
-                items.append(item)
-            self.model.appendRow(items)
+        
+        # Fill a fresh, pre-sized model while it is detached from the view, so
+        # the proxy and view see one reset instead of a signal per appended row
+        model = QStandardItemModel(len(data_frame), len(headers))
+        model.setHorizontalHeaderLabels(headers)
+        for col_idx in range(len(headers)):
+            for row_idx, value in enumerate(data_frame.iloc[:, col_idx].tolist()):
+                model.setItem(row_idx, col_idx, QStandardItem(str(value)))
+        
+        # Swap it in with repaints off; the proxy keeps its sort column and
+        # applies it once to the new model
+        self.table_view.setUpdatesEnabled(False)
+        self.proxy_model.setSourceModel(model)
+        self.model = model
+        self.table_view.setUpdatesEnabled(True)
         
         # Update status
         self.status_label.setText(f"Displaying {len(data_frame)} items")
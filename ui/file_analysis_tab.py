@@ -4,14 +4,12 @@ File Analysis Tab for SharePoint Migration Tool
 This module provides a tab for detailed file-level analysis in the SharePoint Migration Tool.
 """
 
-import os
 import logging
 import pandas as pd
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                              QLabel, QPushButton, QFileDialog,
                              QProgressBar, QMessageBox, QLineEdit,
-                             QSplitter, QCheckBox, QComboBox)
-from PyQt5.QtCore import Qt, QSettings
+                             QCheckBox)
 
 # Import the file analysis view
 from ui.file_analysis_view import FileAnalysisView
@@ -21,6 +19,34 @@ from core.file_scanner import FileSystemScanner
 
 logger = logging.getLogger(__name__)
 
+def _extract_frames(results):
+    """
+    Get the files and issues DataFrames from a scan results dictionary.
+    
+    Args:
+        results (dict): Scan results dictionary
+        
+    Returns:
+        tuple: (files_df, issues_df), either of which may be None
+    """
+    if not isinstance(results, dict):
+        return None, None
+    
+    files_df = None
+    issues_df = None
+    
+    if 'files_df' in results:
+        files_df = results['files_df']
+    elif 'files' in results and isinstance(results['files'], list):
+        files_df = pd.DataFrame(results['files'])
+    
+    if 'issues_df' in results:
+        issues_df = results['issues_df']
+    elif 'issues' in results and isinstance(results['issues'], list):
+        issues_df = pd.DataFrame(results['issues'])
+    
+    return files_df, issues_df
+
 class FileAnalysisTab(QWidget):
     """
     Tab for detailed file-level analysis in the SharePoint Migration Tool.
@@ -185,18 +211,7 @@ class FileAnalysisTab(QWidget):
             return
         
         # Convert results to DataFrames if needed
-        files_df = None
-        issues_df = None
-        
-        if 'files_df' in results:
-            files_df = results['files_df']
-        elif 'files' in results and isinstance(results['files'], list):
-            files_df = pd.DataFrame(results['files'])
-        
-        if 'issues_df' in results:
-            issues_df = results['issues_df']
-        elif 'issues' in results and isinstance(results['issues'], list):
-            issues_df = pd.DataFrame(results['issues'])
+        files_df, issues_df = _extract_frames(results)
         
         # Update the file analysis view
         if files_df is not None:
@@ -7,22 +7,146 @@ searching, and multi-format export capabilities.
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                              QTableView, QLineEdit, QComboBox, 
                              QPushButton, QLabel, QFileDialog, 
-                             QHeaderView, QMessageBox, QApplication,
+                             QHeaderView, QMessageBox,
                              QMenu, QAction, QCheckBox, QToolBar,
-                             QSplitter, QTreeView)
-from PyQt5.QtCore import Qt, QSortFilterProxyModel, QRegExp, QDateTime
-from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush, QIcon
+                             QSplitter)
+from PyQt5.QtCore import Qt, QSortFilterProxyModel, QRegExp, QAbstractTableModel
+from PyQt5.QtGui import QStandardItemModel, QStandardItem, QColor, QBrush, QIcon, QCursor
 import pandas as pd
+import numpy as np
 import os
-import json
 import csv
 import logging
-from pathlib import Path
-import datetime
-import hashlib
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Number of prepared (stringified) frames kept for repeated set_data calls
+PREPARED_CACHE_SIZE = 4
+
+# Brushes shared by every cell instead of being built per data() call
+ISSUE_ROW_BRUSH = QBrush(QColor(255, 240, 240))  # Light red
+CRITICAL_BRUSH = QBrush(QColor(200, 0, 0))  # Red text
+WARNING_BRUSH = QBrush(QColor(255, 140, 0))  # Orange text
+
+class PandasTableModel(QAbstractTableModel):
+    """
+    Read-only table model that serves cells straight from a DataFrame, so
+    nothing is built for rows the view never asks about.
+    """
+    
+    def __init__(self, parent=None):
+        super(PandasTableModel, self).__init__(parent)
+        self._df = pd.DataFrame()
+        self._headers = []
+        self._text = []
+        self._issue_mask = []
+        self._issue_type_col = -1
+    
+    def set_frame(self, df, issue_mask, text=None):
+        """
+        Replace the data shown by the model.
+        
+        Args:
+            df (pandas.DataFrame): The data to display
+            issue_mask (list): One boolean per row, True for rows with issues
+            text (list, optional): Per-column display strings from an earlier
+                set_frame call on the same frame; None entries are converted
+                on first use
+        """
+        self.beginResetModel()
+        self._df = df
+        self._headers = df.columns.tolist()
+        self._text = text if text is not None else [None] * len(self._headers)
+        self._issue_mask = issue_mask
+        self._issue_type_col = self._headers.index('issue_type') if 'issue_type' in self._headers else -1
+        self.endResetModel()
+    
+    def _column_text(self, col):
+        """Return the display strings of a column, converting it on first use."""
+        text = self._text[col]
+        if text is None:
+            text = self._convert_column(self._df.iloc[:, col])
+            self._text[col] = text
+        return text
+    
+    @staticmethod
+    def _convert_column(series):
+        """
+        Convert a column to display strings, picking the conversion once per
+        dtype rather than calling str() on every cell.
+        
+        Args:
+            series (pandas.Series): The column to convert
+            
+        Returns:
+            list: Display strings; missing values are blank
+        """
+        dtype = series.dtype
+        if isinstance(dtype, pd.StringDtype):
+            # Already strings; only the missing values need replacing
+            return series.fillna("").tolist()
+        if pd.api.types.is_integer_dtype(dtype) or pd.api.types.is_bool_dtype(dtype):
+            if not series.hasnans:
+                return series.to_numpy().astype(str).tolist()
+        elif pd.api.types.is_float_dtype(dtype):
+            text = series.to_numpy().astype(str)
+            text[series.isna().to_numpy()] = ""
+            return text.tolist()
+        elif isinstance(dtype, np.dtype) and dtype.kind == 'M':
+            # Whole-second timestamps, as scans record them, format like str(Timestamp)
+            if not (series.dt.microsecond.any() or series.dt.nanosecond.any()):
+                return series.dt.strftime('%Y-%m-%d %H:%M:%S').fillna("").tolist()
+        
+        # Object and other columns can hold anything, so fall back to str()
+        values = series.to_numpy(dtype=object)
+        text = list(map(str, values))
+        for row_idx in pd.isna(values).nonzero()[0]:
+            text[row_idx] = ""
+        return text
+    
+    def issue_mask(self):
+        """Return the per-row issue flags of the current frame."""
+        return self._issue_mask
+    
+    def column_texts(self):
+        """Return the per-column display strings converted so far."""
+        return self._text
+    
+    def rowCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self._df)
+    
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self._headers)
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and section < len(self._headers):
+            return self._headers[section]
+        return super(PandasTableModel, self).headerData(section, orientation, role)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        
+        if role == Qt.DisplayRole:
+            return self._column_text(col)[row]
+        
+        if role == Qt.BackgroundRole:
+            # Light red background for rows with issues
+            return ISSUE_ROW_BRUSH if self._issue_mask[row] else None
+        
+        if role == Qt.ForegroundRole and col == self._issue_type_col:
+            issue_text = self._column_text(col)[row].lower()
+            if 'critical' in issue_text:
+                return CRITICAL_BRUSH
+            if 'warning' in issue_text:
+                return WARNING_BRUSH
+            if self._issue_mask[row] and issue_text:
+                return CRITICAL_BRUSH
+        
+        return None
+
 class FileAnalysisView(QWidget):
     """
     A specialized widget for detailed file-level analysis with advanced
@@ -33,6 +157,7 @@ class FileAnalysisView(QWidget):
         super(FileAnalysisView, self).__init__(parent)
         self.df = None  # DataFrame to hold the file data
         self.issue_df = None  # DataFrame to hold issue data
+        self._prepared = OrderedDict()  # (frame ids, shape) -> (frames, column text, issue mask)
         self.init_ui()
         
     def init_ui(self):
@@ -114,6 +239,8 @@ class FileAnalysisView(QWidget):
         self.table_view.setAlternatingRowColors(True)
         self.table_view.setSelectionBehavior(QTableView.SelectRows)
         self.table_view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        # Size columns from the visible rows plus a sample of 64, not every file
+        self.table_view.horizontalHeader().setResizeContentsPrecision(64)
         self.table_view.horizontalHeader().setSectionsMovable(True)
         self.table_view.verticalHeader().setVisible(False)
         self.table_view.setSelectionMode(QTableView.ExtendedSelection)
@@ -153,7 +280,7 @@ class FileAnalysisView(QWidget):
         main_layout.addWidget(splitter, 1)  # 1 = stretch factor
         
         # Create model and proxy model for sorting/filtering
-        self.model = QStandardItemModel()
+        self.model = PandasTableModel()
         self.proxy_model = QSortFilterProxyModel()
         self.proxy_model.setSourceModel(self.model)
         self.proxy_model.setFilterCaseSensitivity(Qt.CaseInsensitive)
@@ -185,47 +312,23 @@ class FileAnalysisView(QWidget):
         self.df = file_data
         self.issue_df = issue_data
         
-        # Clear existing model
-        self.model.clear()
-        
-        # Set headers
+        # Hand the frame to the model; cells are converted as the view asks for them.
+        # Showing the same frames again (e.g. switching tabs) reuses the strings
+        # and issue mask worked out last time.
         headers = file_data.columns.tolist()
-        self.model.setHorizontalHeaderLabels(headers)
-        
-        # Populate the model with data and colorize based on issues
-        for row_idx, row in file_data.iterrows():
-            items = []
-            has_issue = False
-            
-            # Determine if this file has issues
-            if 'has_issues' in row:
-                has_issue = row['has_issues']
-            elif issue_data is not None and 'file_path' in issue_data.columns:
-                has_issue = issue_data['file_path'].str.contains(row['full_path']).any() if 'full_path' in row else False
-            
-            # Create items with appropriate colors based on issue status
-            for col_idx, value in enumerate(row):
-                item = QStandardItem(str(value))
-                
-                # Apply color based on issue status
-                if has_issue:
-                    # Add background color for rows with issues
-                    item.setBackground(QBrush(QColor(255, 240, 240)))  # Light red
-                    
-                    # If this is an issue type column, make it red text
-                    if headers[col_idx] == 'issue_type' and value:
-                        item.setForeground(QBrush(QColor(200, 0, 0)))  # Red text
-                
-                # Set color for specific issue types in the issue column
-                if headers[col_idx] == 'issue_type':
-                    if 'critical' in str(value).lower():
-                        item.setForeground(QBrush(QColor(200, 0, 0)))  # Red text
-                    elif 'warning' in str(value).lower():
-                        item.setForeground(QBrush(QColor(255, 140, 0)))  # Orange text
-                
-                items.append(item)
-            
-            self.model.appendRow(items)
+        key = (id(file_data), file_data.shape, id(issue_data))
+        prepared = self._prepared.get(key)
+        if prepared is not None and prepared[0] is file_data and prepared[1] is issue_data:
+            self._prepared.move_to_end(key)
+            _, _, text, issue_mask = prepared
+            self.model.set_frame(file_data, issue_mask, text)
+        else:
+            issue_mask = self._issue_mask(file_data, issue_data)
+            self.model.set_frame(file_data, issue_mask)
+            # The frames are held alongside their key so the ids cannot be reused
+            self._prepared[key] = (file_data, issue_data, self.model.column_texts(), issue_mask)
+            while len(self._prepared) > PREPARED_CACHE_SIZE:
+                self._prepared.popitem(last=False)
         
         # Update column filter combo box
         self.column_combo.clear()
@@ -237,7 +340,28 @@ class FileAnalysisView(QWidget):
         
         # Update status
         self.status_label.setText(f"Displaying {len(file_data)} files")
-        logger.info(f"File analysis view populated with {len(file_data)} files")
+        logger.info("File analysis view populated with %d files", len(file_data))
+    
+    def _issue_mask(self, file_data, issue_data):
+        """
+        Work out which rows of file_data have issues.
+        
+        Args:
+            file_data (pandas.DataFrame): The file data to display
+            issue_data (pandas.DataFrame, optional): The issue data
+            
+        Returns:
+            list: One boolean per row
+        """
+        if 'has_issues' in file_data.columns:
+            return file_data['has_issues'].fillna(False).astype(bool).tolist()
+        path_col = 'full_path' if 'full_path' in file_data.columns else 'path'
+        if issue_data is not None and 'file_path' in issue_data.columns and path_col in file_data.columns:
+            # Issues are recorded against the file's full path, so one hashed
+            # membership test per row replaces scanning every issue path
+            issue_paths = frozenset(issue_data['file_path'].dropna().unique())
+            return file_data[path_col].isin(issue_paths).tolist()
+        return [False] * len(file_data)
     
     def update_issue_filter(self):
         """Update the issue type filter with values from the issue data."""
@@ -280,24 +404,28 @@ class FileAnalysisView(QWidget):
         # Reset the proxy model's filter
         self.proxy_model.setFilterRegExp(QRegExp("", Qt.CaseInsensitive, QRegExp.FixedString))
         
+        # Which rows have issues was worked out once in set_data; the filter
+        # reads that mask instead of looking each row up again
+        issue_mask = self.model.issue_mask()
+        
+        # Likewise flag the rows that have the selected issue type with one
+        # vectorised comparison, not a per-row search of the issue table
+        type_mask = None
+        if issue_type and self.issue_df is not None and {'file_path', 'issue_type'} <= set(self.issue_df.columns):
+            path_col = 'full_path' if 'full_path' in self.df.columns else 'path'
+            if path_col in self.df.columns:
+                type_paths = frozenset(self.issue_df.loc[self.issue_df['issue_type'] == issue_type, 'file_path'].dropna())
+                type_mask = self.df[path_col].isin(type_paths).tolist()
+        
         # Combine all filters using a custom filtering function
         def custom_filter(source_row, source_parent):
             # First check issue filter
             if show_issues_only or issue_type:
                 # If we're showing issues only, check if this row has an issue
-                has_issue = False
-                has_matching_issue_type = True
+                has_issue = issue_mask[source_row]
                 
-                if 'has_issues' in self.df.columns:
-                    has_issue = self.df.iloc[source_row]['has_issues']
-                elif self.issue_df is not None and 'file_path' in self.issue_df.columns:
-                    file_path = self.model.index(source_row, self.df.columns.get_loc('full_path') if 'full_path' in self.df.columns else 0).data()
-                    has_issue = self.issue_df['file_path'].str.contains(file_path).any()
-                    
-                    # If we're filtering by issue type, check if this row has that issue type
-                    if issue_type and has_issue:
-                        matching_issues = self.issue_df[self.issue_df['file_path'].str.contains(file_path)]
-                        has_matching_issue_type = matching_issues['issue_type'].str.contains(issue_type).any() if not matching_issues.empty else False
+                # If we're filtering by issue type, check if this row has that issue type
+                has_matching_issue_type = type_mask[source_row] if type_mask is not None else True
                 
                 if show_issues_only and not has_issue:
                     return False
@@ -390,7 +518,7 @@ class FileAnalysisView(QWidget):
         
         # Find any issues for this file
         if self.issue_df is not None and 'file_path' in self.issue_df.columns:
-            matching_issues = self.issue_df[self.issue_df['file_path'].str.contains(file_path)]
+            matching_issues = self.issue_df[self.issue_df['file_path'] == file_path]
             
             if not matching_issues.empty:
                 # Set up the issue model headers
@@ -407,6 +535,8 @@ class FileAnalysisView(QWidget):
     def refresh_data(self):
         """Refresh the data view."""
         if self.df is not None:
+            # The frames may have been changed in place, so convert them again
+            self._prepared.clear()
             self.set_data(self.df, self.issue_df)
     
     def show_export_menu(self):
@@ -518,7 +648,7 @@ class FileAnalysisView(QWidget):
                 "Export Successful",
                 f"Data successfully exported to {os.path.basename(file_path)}"
             )
-            logger.info(f"Data exported to {file_path} in {format_type} format")
+            logger.info("Data exported to %s in %s format", file_path, format_type)
             
         except Exception as e:
             QMessageBox.critical(
@@ -8,6 +8,7 @@ import sys
 import os
 import logging
 import pandas as pd
+from functools import partial
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, 
                            QVBoxLayout, QHBoxLayout, QLabel, 
                            QPushButton, QFileDialog, QStatusBar, 
@@ -45,8 +46,8 @@ class MainWindow(QMainWindow):
         # Create main layout
         self.layout = QVBoxLayout(self.central_widget)
         
-        # Initialize data processor
-        self.data_processor = DataProcessor()
+        # Data processor is created on first use (see data_processor)
+        self._data_processor = None
         
         # Create menus
         self.create_menus()
@@ -72,6 +73,13 @@ class MainWindow(QMainWindow):
         # Load settings
         self.load_settings()
     
+    @property
+    def data_processor(self):
+        """Data processor, created on first use so its analyzers are not built at startup"""
+        if self._data_processor is None:
+            self._data_processor = DataProcessor()
+        return self._data_processor
+    
     def add_header(self):
         """Add header section with title and controls"""
         header_layout = QHBoxLayout()
@@ -118,22 +126,22 @@ class MainWindow(QMainWindow):
         
         # Create and add the Dashboard tab
         self.dashboard_tab = DashboardWidget()
-        self.tabs.addTab(self.dashboard_tab, "Dashboard")
+        self._dashboard_index = self.tabs.addTab(self.dashboard_tab, "Dashboard")
         
         # Add Analysis tab with enhanced data view
         self.analysis_tab = QWidget()
         analysis_layout = QVBoxLayout(self.analysis_tab)
         self.enhanced_view = EnhancedDataView()
         analysis_layout.addWidget(self.enhanced_view)
-        self.tabs.addTab(self.analysis_tab, "Analysis")
+        analysis_index = self.tabs.addTab(self.analysis_tab, "Analysis")
         
         # Add File Analysis tab
         self.file_analysis_tab = FileAnalysisTab()
-        self.tabs.addTab(self.file_analysis_tab, "File Analysis")
+        file_analysis_index = self.tabs.addTab(self.file_analysis_tab, "File Analysis")
         
         # Add Migration tab with updated version
         self.migration_tab = MigrationTab()
-        self.tabs.addTab(self.migration_tab, "Migration")
+        self._migration_index = self.tabs.addTab(self.migration_tab, "Migration")
         
         # Add Settings tab
         self.settings_tab = QWidget()
@@ -141,7 +149,19 @@ class MainWindow(QMainWindow):
         self.settings_widget = SettingsWidget()
         self.settings_widget.settings_changed.connect(self.on_settings_changed)
         settings_layout.addWidget(self.settings_widget)
-        self.tabs.addTab(self.settings_tab, "Settings")
+        self._settings_index = self.tabs.addTab(self.settings_tab, "Settings")
+        
+        # Scan results are handed to a tab when it is first shown. The update
+        # methods are looked up once here rather than probed after every scan.
+        self._tab_updaters = [
+            (index, update) for index, update in (
+                (self._dashboard_index, self.dashboard_tab.update_with_results),
+                (analysis_index, getattr(self.analysis_tab, 'update_data_view', None)),
+                (file_analysis_index, getattr(self.file_analysis_tab, 'update_with_results', None))
+            ) if update is not None
+        ]
+        self._pending_tab_updates = {}
+        self.tabs.currentChanged.connect(self._refresh_current_tab)
         
         # Add tabs to main layout
         self.layout.addWidget(self.tabs, 1)  # 1 = stretch factor
@@ -282,19 +302,15 @@ class MainWindow(QMainWindow):
                     elif 'files_df' not in processed_results and 'scan_data' in processed_results:
                         processed_results['files_df'] = processed_results['scan_data']
                 
-                # Update the dashboard with the processed results
-                self.dashboard_tab.update_with_results(processed_results)
-                
-                # Update analysis tab
-                if hasattr(self.analysis_tab, 'update_data_view'):
-                    self.analysis_tab.update_data_view(processed_results)
-                
-                # Update File Analysis tab
-                if hasattr(self.file_analysis_tab, 'update_with_results'):
-                    self.file_analysis_tab.update_with_results(processed_results)
+                # Queue the results for each tab; only the one on screen is
+                # updated now, the others when the user switches to them
+                self._pending_tab_updates = {
+                    index: partial(update, processed_results) for index, update in self._tab_updaters
+                }
                 
                 # Switch to dashboard tab
-                self.tabs.setCurrentIndex(0)
+                self.tabs.setCurrentIndex(self._dashboard_index)
+                self._refresh_current_tab(self._dashboard_index)
             
             except Exception as e:
                 logging.error(f"Error processing scan results: {str(e)}")
@@ -320,6 +336,18 @@ class MainWindow(QMainWindow):
         except Exception as e:
             error_callback(str(e))
     
+    def _refresh_current_tab(self, index):
+        """Apply scan results that were held back until this tab is shown"""
+        update = self._pending_tab_updates.pop(index, None)
+        if update is None:
+            return
+        
+        try:
+            update()
+        except Exception as e:
+            logging.error(f"Error processing scan results: {str(e)}")
+            QMessageBox.warning(self, "Error", f"Error processing scan results: {str(e)}")
+    
     def export_report(self):
         """Export the current scan results"""
         current_tab = self.tabs.currentIndex()
@@ -335,11 +363,11 @@ class MainWindow(QMainWindow):
     
     def go_to_settings(self):
         """Switch to the Settings tab"""
-        self.tabs.setCurrentIndex(4)  # Assuming Settings is the fifth tab
+        self.tabs.setCurrentIndex(self._settings_index)
     
     def go_to_migration(self):
         """Switch to the Migration tab"""
-        self.tabs.setCurrentIndex(3)  # Assuming Migration is the fourth tab
+        self.tabs.setCurrentIndex(self._migration_index)
     
     def on_settings_changed(self, settings):
         """Handle settings changes from settings widget"""
@@ -199,7 +199,7 @@ class MigrationTab(QWidget):
         library_layout.addWidget(self.target_lib_combo)
         
         self.refresh_libs_btn = QPushButton("Refresh")
-        self.refresh_libs_btn.clicked.connect(self.refresh_libraries)
+        self.refresh_libs_btn.clicked.connect(lambda: self.refresh_libraries(refresh=True))
         self.refresh_libs_btn.setEnabled(False)
         library_layout.addWidget(self.refresh_libs_btn)
         
@@ -386,8 +386,8 @@ class MigrationTab(QWidget):
             
             self.update_start_button()
     
-    def refresh_libraries(self):
-        """Refresh the list of document libraries"""
+    def refresh_libraries(self, refresh=False):
+        """Refresh the list of document libraries, reloading them from SharePoint if refresh is set"""
         if not self.is_authenticated:
             return
             
@@ -396,7 +396,7 @@ class MigrationTab(QWidget):
         self.progress_bar.setRange(0, 0)  # Indeterminate mode
         
         # Get libraries
-        self.document_libraries = self.sp_integration.get_document_libraries()
+        self.document_libraries = self.sp_integration.get_document_libraries(refresh=refresh)
         
         # Update combo box
         self.target_lib_combo.clear()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Filesystem cleanup utilities for the SharePoint Data Migration Cleanup Tool.
+Removes the temporary trees used to stage files for upload.
+"""
+
+import os
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('sharepoint_migration_tool')
+
+# Threads unlinking files in parallel
+REMOVE_WORKERS = 8
+
+# Files unlinked per task
+UNLINK_BATCH_SIZE = 256
+
+def _unlink_all(paths):
+    """
+    Unlink a batch of files
+    
+    Args:
+        paths (list): Paths of the files to remove
+    """
+    for path in paths:
+        os.unlink(path)
+
+def remove_tree(path, max_workers=REMOVE_WORKERS):
+    """
+    Delete a directory tree, unlinking its files on a thread pool
+    
+    Behaves like shutil.rmtree without an error handler: symbolic links are
+    removed rather than followed, and the first error is raised.
+    
+    Args:
+        path (str): Directory to remove
+        max_workers (int): Number of threads unlinking files
+    """
+    dirs = []
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        batch = []
+        stack = [path]
+        
+        while stack:
+            dir_path = stack.pop()
+            dirs.append(dir_path)
+            
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        batch.append(entry.path)
+                        if len(batch) >= UNLINK_BATCH_SIZE:
+                            futures.append(executor.submit(_unlink_all, batch))
+                            batch = []
+        
+        if batch:
+            futures.append(executor.submit(_unlink_all, batch))
+        
+        for future in futures:
+            future.result()
+    
+    # Directories were listed parents first, so remove them in reverse
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+    
+    logger.debug("Removed %d directories under %s", len(dirs), path)